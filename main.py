@@ -41,6 +41,8 @@ def main():
                        help='Strategy for dark player (default: random)')
     parser.add_argument('--board-size', type=int, default=4,
                        help='Size of the game board (default: 4)')
+    parser.add_argument('--search-depth', type=int, default=0,
+                       help='Plies greedy/defensive players search ahead (default: 0, no search)')
     parser.add_argument('--parallel', action='store_true',
                        help='Run games in parallel (faster)')
     parser.add_argument('--verbose', action='store_true',
@@ -86,7 +88,7 @@ def run_simulation(data_manager: GameDataManager, args):
     print(f"Parallel execution: {args.parallel}")
     print()
     
-    simulator = GameSimulator(data_manager)
+    simulator = GameSimulator(data_manager, search_depth=args.search_depth)
     
     try:
         results = simulator.run_batch_simulation(
@@ -123,7 +125,7 @@ def run_tournament(data_manager: GameDataManager, args):
     print(f"Board size: {args.board_size}x{args.board_size}")
     print()
     
-    simulator = GameSimulator(data_manager)
+    simulator = GameSimulator(data_manager, search_depth=args.search_depth)
     
     try:
         tournament_results = simulator.run_tournament(
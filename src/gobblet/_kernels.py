@@ -0,0 +1,121 @@
+"""
+Integer kernels over the packed top grid (see bitboard).
+
+Each kernel handles every cell at once with arithmetic on the 4-bit cell
+fields of the packed state, instead of looping over cells in Python. Masks
+returned here are in the same layout, with the occupied bit of each
+selected cell set.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .bitboard import COLOR_SHIFT, NIBBLE_BITS, SIZE_SHIFT, line_patterns, occupied_mask
+
+
+@lru_cache(maxsize=None)
+def _cell_positions(size: int) -> Tuple[Tuple[int, int], ...]:
+    """Get the (row, col) of every cell index for a board size."""
+    return tuple(divmod(cell, size) for cell in range(size * size))
+
+
+def empty_mask(state: int, size: int) -> int:
+    """
+    Get the cells of the packed state that hold no piece.
+    
+    Args:
+        state: Packed top grid
+        size: The size of the board
+        
+    Returns:
+        Cell mask of the empty cells
+    """
+    return ~state & occupied_mask(size)
+
+
+def cover_mask(state: int, color_index: int, piece_size: int, size: int) -> int:
+    """
+    Get the cells whose top piece is the opponent's and smaller than piece_size.
+    
+    The size fields of all cells are compared in one subtraction: each cell
+    computes (4 + piece_size - 1) - top_size, which cannot borrow from its
+    neighbour, and keeps bit 2 exactly when top_size < piece_size.
+    
+    Args:
+        state: Packed top grid
+        color_index: Color of the covering piece (0 light, 1 dark)
+        piece_size: Size value of the covering piece
+        size: The size of the board
+        
+    Returns:
+        Cell mask of the opponent cells the piece could cover
+    """
+    occupied = occupied_mask(size)
+    top_sizes = (state >> SIZE_SHIFT) & (occupied * 0b11)
+    smaller = ((((occupied << 2) | (occupied * (piece_size - 1))) - top_sizes) >> 2) & occupied
+    
+    dark_tops = (state >> COLOR_SHIFT) & occupied
+    opponent = dark_tops if color_index == 0 else state & occupied & ~dark_tops
+    return opponent & smaller
+
+
+def valid_move_mask(state: int, color_index: int, piece_size: int, size: int) -> int:
+    """
+    Get the cells an existing piece can move to: empty cells or coverable opponent cells.
+    
+    Args:
+        state: Packed top grid
+        color_index: Color of the moving piece (0 light, 1 dark)
+        piece_size: Size value of the moving piece
+        size: The size of the board
+        
+    Returns:
+        Cell mask of the valid destinations
+    """
+    return empty_mask(state, size) | cover_mask(state, color_index, piece_size, size)
+
+
+def check_winner_u64(state: int, size: int) -> Optional[int]:
+    """
+    Get the color index owning the first complete line, in row, column, diagonal order.
+    
+    Args:
+        state: Packed top grid
+        size: The size of the board
+        
+    Returns:
+        0 for light, 1 for dark, or None if no line is complete
+    """
+    for mask, (light_pattern, dark_pattern) in line_patterns(size):
+        line = state & mask
+        if line == light_pattern:
+            return 0
+        if line == dark_pattern:
+            return 1
+    return None
+
+
+def mask_cells(mask: int, size: int) -> List[Tuple[int, int]]:
+    """
+    List the (row, col) of every cell in a mask, in row-major order.
+    
+    Args:
+        mask: Cell mask in packed-state layout
+        size: The size of the board
+        
+    Returns:
+        List of (row, col) positions
+    """
+    return list(_mask_cells(mask, size))
+
+
+@lru_cache(maxsize=1 << 16)
+def _mask_cells(mask: int, size: int) -> Tuple[Tuple[int, int], ...]:
+    """Decode a cell mask; the same few masks recur constantly, so results are cached."""
+    positions = _cell_positions(size)
+    cells = []
+    while mask:
+        low_bit = mask & -mask
+        cells.append(positions[(low_bit.bit_length() - 1) // NIBBLE_BITS])
+        mask ^= low_bit
+    return tuple(cells)
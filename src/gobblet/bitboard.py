@@ -0,0 +1,79 @@
+"""
+Bit-packed board encodings for Gobblet.
+
+The top piece of every cell is packed into 4 bits of a single int, cell-major
+(cell = row * size + col): bit 0 is set when the cell is occupied, bits 1-2
+hold the piece size value and bit 3 the color index (0 light, 1 dark). A 4x4
+board fits in 64 bits.
+
+Cell bitboards use one bit per cell instead, e.g. for the cells holding a
+given (color, size).
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+
+NIBBLE_BITS = 4
+NIBBLE_MASK = 0xF
+OCCUPIED = 0b0001
+SIZE_SHIFT = 1
+COLOR_SHIFT = 3
+
+
+@lru_cache(maxsize=None)
+def line_cells(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Get the cell indices of every winning line for a board size.
+    
+    Lines are rows, then columns, then the diagonal and anti-diagonal.
+    
+    Args:
+        size: The size of the board
+        
+    Returns:
+        One tuple of cell indices per line
+    """
+    rows = tuple(tuple(row * size + col for col in range(size)) for row in range(size))
+    cols = tuple(tuple(row * size + col for row in range(size)) for col in range(size))
+    diagonals = (tuple(i * size + i for i in range(size)),
+                 tuple(i * size + size - 1 - i for i in range(size)))
+    return rows + cols + diagonals
+
+
+@lru_cache(maxsize=None)
+def line_patterns(size: int) -> Tuple[Tuple[int, Tuple[int, int]], ...]:
+    """
+    Get (mask, (light_pattern, dark_pattern)) per winning line of the packed state.
+    
+    The mask keeps the occupied and color bits of the line's cells, so
+    state & mask == pattern[color_index] exactly when every top piece on the
+    line is that color.
+    
+    Args:
+        size: The size of the board
+        
+    Returns:
+        One (mask, patterns) pair per line, in line_cells order
+    """
+    color_and_occupied = (1 << COLOR_SHIFT) | OCCUPIED
+    patterns = []
+    for cells in line_cells(size):
+        shifts = [cell * NIBBLE_BITS for cell in cells]
+        mask = sum(color_and_occupied << shift for shift in shifts)
+        light = sum(OCCUPIED << shift for shift in shifts)
+        patterns.append((mask, (light, mask)))
+    return tuple(patterns)
+
+
+@lru_cache(maxsize=None)
+def line_occupied_masks(size: int) -> Tuple[int, ...]:
+    """Get the occupied bits of each winning line's cells in the packed state, in line_cells order."""
+    return tuple(sum(OCCUPIED << (cell * NIBBLE_BITS) for cell in cells) for cells in line_cells(size))
+
+
+@lru_cache(maxsize=None)
+def occupied_mask(size: int) -> int:
+    """Get the occupied bit of every cell of the packed state."""
+    return sum(OCCUPIED << (cell * NIBBLE_BITS) for cell in range(size * size))
+
@@ -2,13 +2,65 @@
 Board representation for Gobblet game.
 """
 
-from typing import List, Optional, Tuple, Set
+import copy
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Set
+from .bitboard import (COLOR_SHIFT, NIBBLE_BITS, NIBBLE_MASK, OCCUPIED, SIZE_SHIFT,
+                       line_cells, line_occupied_masks, occupied_mask)
+from ._kernels import check_winner_u64, cover_mask, empty_mask, mask_cells, valid_move_mask
 from .piece import Piece, PieceColor, PieceSize
 
 
+_COLOR_INDEX = {PieceColor.LIGHT: 0, PieceColor.DARK: 1}
+_COLORS = (PieceColor.LIGHT, PieceColor.DARK)  # Indexed by color index
+
+
+@lru_cache(maxsize=None)
+def _zobrist_keys(size: int) -> Tuple[int, ...]:
+    """
+    Get the Zobrist keys for a board size.
+    
+    One random 64-bit key per (cell, color, piece size). Stacks always grow in
+    strictly increasing size, so these fully describe every stack.
+    
+    Args:
+        size: The size of the board
+        
+    Returns:
+        Keys indexed by ((row * size + col) * 2 + color_index) * 3 + size - 1
+    """
+    rng = random.Random(0x60BB1E7 + size)
+    return tuple(rng.getrandbits(64) for _ in range(size * size * 2 * 3))
+
+
+@lru_cache(maxsize=None)
+def _line_tables(size: int) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[int, ...], ...]]:
+    """
+    Get the winning lines for a board size and the lines through each cell.
+    
+    Lines are rows, then columns, then the diagonal and anti-diagonal, which
+    is the order check_winner reports them in. Cells are flat indices,
+    row * size + col, matching Board._cells.
+    
+    Args:
+        size: The size of the board
+        
+    Returns:
+        Tuple of (lines, lines_through) where lines holds the cells of each
+        line and lines_through[cell] holds the ids of the lines through it
+    """
+    lines = line_cells(size)
+    lines_through = tuple(tuple(line_id for line_id, line in enumerate(lines) if cell in line)
+                          for cell in range(size * size))
+    return lines, lines_through
+
+
 class BoardPosition:
     """Represents a position on the board that can hold multiple pieces."""
     
+    __slots__ = ("pieces",)
+    
     def __init__(self):
         """Initialize an empty board position."""
         self.pieces: List[Piece] = []  # Stack of pieces, top piece is last
@@ -70,6 +122,10 @@ class BoardPosition:
 class Board:
     """Represents the Gobblet game board."""
     
+    __slots__ = ("size", "_cells", "positions", "_stacks", "zobrist", "_top_u64", "_piece_bits",
+                 "_occupied_mask", "_zobrist_keys", "_lines", "_lines_through", "_line_masks",
+                 "_line_counts", "_full_lines")
+    
     def __init__(self, size: int = 4):
         """
         Initialize the board.
@@ -78,7 +134,24 @@ class Board:
             size: The size of the board (default 4x4)
         """
         self.size = size
-        self.positions = [[BoardPosition() for _ in range(size)] for _ in range(size)]
+        # Cells are stored flat, row-major (row * size + col); positions holds
+        # row views of the same BoardPosition objects
+        self._cells = [BoardPosition() for _ in range(size * size)]
+        self.positions = [self._cells[row * size:(row + 1) * size] for row in range(size)]
+        self._stacks = [position.pieces for position in self._cells]  # Same lists, one lookup away
+        self.zobrist = 0  # Incremental hash of every piece on the board
+        self._top_u64 = 0  # Top piece of each cell packed into 4 bits, cell-major
+        self._piece_bits = [0] * 6  # Cells holding each (color, size), covered pieces included
+        self._occupied_mask = occupied_mask(size)  # Occupied bit of every cell
+        self._zobrist_keys = _zobrist_keys(size)
+        
+        # Winning lines (rows, columns, diagonals) and the lines through each cell
+        self._lines, self._lines_through = _line_tables(size)
+        self._line_masks = line_occupied_masks(size)  # Occupied bits of each line's cells, packed layout
+        
+        # Per-line counts of top pieces by color index, and complete lines per color
+        self._line_counts = [[0, 0] for _ in self._lines]
+        self._full_lines = [0, 0]
     
     def place_piece(self, piece: Piece, row: int, col: int, is_new_piece: bool = True) -> bool:
         """
@@ -100,11 +173,15 @@ class Board:
         if not self._is_placement_valid(piece, row, col, is_new_piece):
             return False
         
-        if self.positions[row][col].add_piece(piece):
-            piece.position = (row, col)
-            return True
-        
-        return False
+        # _is_placement_valid has checked the piece covers the stack, as BoardPosition.add_piece would
+        stack = self._stacks[row * self.size + col]
+        previous_top = stack[-1] if stack else None
+        stack.append(piece)
+        piece.position = (row, col)
+        self._toggle_piece(piece, row, col)
+        self._set_top_nibble(row, col, piece)
+        self._update_lines(row, col, previous_top, piece)
+        return True
     
     def remove_piece(self, row: int, col: int) -> Optional[Piece]:
         """
@@ -120,7 +197,17 @@ class Board:
         if not self._is_valid_position(row, col):
             return None
         
-        return self.positions[row][col].remove_top_piece()
+        stack = self._stacks[row * self.size + col]
+        if not stack:
+            return None
+        
+        piece = stack.pop()
+        piece.position = None
+        new_top = stack[-1] if stack else None
+        self._toggle_piece(piece, row, col)
+        self._set_top_nibble(row, col, new_top)
+        self._update_lines(row, col, piece, new_top)
+        return piece
     
     def get_top_piece(self, row: int, col: int) -> Optional[Piece]:
         """
@@ -136,14 +223,15 @@ class Board:
         if not self._is_valid_position(row, col):
             return None
         
-        return self.positions[row][col].top_piece()
+        stack = self._stacks[row * self.size + col]
+        return stack[-1] if stack else None
     
     def is_position_empty(self, row: int, col: int) -> bool:
         """Check if a position is empty."""
         if not self._is_valid_position(row, col):
             return False
         
-        return self.positions[row][col].is_empty()
+        return not self._stacks[row * self.size + col]
     
     def check_winner(self) -> Optional[PieceColor]:
         """
@@ -152,36 +240,154 @@ class Board:
         Returns:
             The winning color, or None if no winner
         """
-        # Check rows
-        for row in range(self.size):
-            winner = self._check_line([(row, col) for col in range(self.size)])
-            if winner:
-                return winner
+        light_lines, dark_lines = self._full_lines
+        if not light_lines and not dark_lines:
+            return None
+        if not dark_lines:
+            return PieceColor.LIGHT
+        if not light_lines:
+            return PieceColor.DARK
+        
+        # Both colors have a line; the first line found (rows, columns,
+        # diagonals) wins
+        color_index = check_winner_u64(self._top_u64, self.size)
+        return None if color_index is None else _COLORS[color_index]
+    
+    def wins_for(self, color: PieceColor) -> bool:
+        """
+        Check if the given color is the winner, using the incremental line counts.
+        
+        Equivalent to check_winner() == color, but O(1) unless both colors
+        have a complete line.
+        
+        Args:
+            color: The color to check
+            
+        Returns:
+            True if check_winner() would return this color
+        """
+        color_index = _COLOR_INDEX[color]
+        if not self._full_lines[color_index]:
+            return False
+        if not self._full_lines[1 - color_index]:
+            return True
+        return self.check_winner() == color
+    
+    def completes_line(self, color: PieceColor, row: int, col: int) -> bool:
+        """
+        Check if a top piece of the given color at (row, col) would complete a line.
+        
+        Only the lines through (row, col) are consulted, using the per-line
+        counts, so no trial move is needed. Placement legality is not checked.
+        
+        Args:
+            color: The color of the piece being placed
+            row: Row position
+            col: Column position
+            
+        Returns:
+            True if some line through the cell would be entirely this color
+        """
+        color_index = _COLOR_INDEX[color]
+        stack = self._stacks[row * self.size + col]
+        top_piece = stack[-1] if stack else None
+        # The cell itself only adds to the count if it isn't already this color
+        needed = self.size if top_piece is not None and top_piece.color == color else self.size - 1
+        
+        for line_id in self._lines_through[row * self.size + col]:
+            if self._line_counts[line_id][color_index] == needed:
+                return True
+        return False
+    
+    def can_place(self, piece: Piece, row: int, col: int, is_new_piece: bool = True) -> bool:
+        """
+        Check if a piece could be placed at a position, without placing it.
         
-        # Check columns
-        for col in range(self.size):
-            winner = self._check_line([(row, col) for row in range(self.size)])
-            if winner:
-                return winner
+        Args:
+            piece: The piece to place
+            row: Row position
+            col: Column position
+            is_new_piece: True if placing a new piece from off-board
+            
+        Returns:
+            True if place_piece would succeed
+        """
+        return self._is_valid_position(row, col) and self._is_placement_valid(piece, row, col, is_new_piece)
+    
+    def candidate_wincells(self, color: PieceColor) -> List[Tuple[int, int, int]]:
+        """
+        Get the cells that would complete a line for the given color.
         
-        # Check diagonals
-        winner = self._check_line([(i, i) for i in range(self.size)])
-        if winner:
-            return winner
+        These are the remaining cells of lines where the color already owns
+        every other cell, which is where any immediate win or block must land.
+        
+        Args:
+            color: The color to find completing cells for
+            
+        Returns:
+            List of (row, col, min_cover_size) tuples, where min_cover_size is
+            the smallest piece size value that can be placed on the cell
+        """
+        color_index = _COLOR_INDEX[color]
+        target = self.size - 1
+        cells = {}
+        
+        for line_id, counts in enumerate(self._line_counts):
+            if counts[color_index] != target:
+                continue
+            for cell in self._lines[line_id]:
+                stack = self._stacks[cell]
+                top_piece = stack[-1] if stack else None
+                if top_piece is None or top_piece.color != color:
+                    min_size = top_piece.size.value + 1 if top_piece else PieceSize.SMALL.value
+                    if min_size <= PieceSize.LARGE.value:
+                        cells[cell] = min_size
+                    break
+        
+        return [divmod(cell, self.size) + (min_size,) for cell, min_size in cells.items()]
+    
+    def line_score(self, color: PieceColor) -> int:
+        """
+        Static evaluation of the lines from one color's point of view.
         
-        winner = self._check_line([(i, self.size - 1 - i) for i in range(self.size)])
-        if winner:
-            return winner
+        Each line only one color occupies counts the square of that color's
+        cells, positive for the given color and negative for the opponent.
         
-        return None
+        Args:
+            color: The color to score for
+        
+        Returns:
+            The evaluation score
+        """
+        color_index = _COLOR_INDEX[color]
+        score = 0
+        for counts in self._line_counts:
+            own = counts[color_index]
+            other = counts[1 - color_index]
+            if not other:
+                score += own * own
+            elif not own:
+                score -= other * other
+        return score
+    
+    def count_pieces(self, color: PieceColor) -> Dict[PieceSize, int]:
+        """
+        Count the pieces of a color on the board, including covered ones.
+        
+        Args:
+            color: The color to count
+        
+        Returns:
+            Dictionary mapping each piece size to its count
+        """
+        # One piece bitboard per (color, size) holds a bit per piece
+        first = _COLOR_INDEX[color] * 3
+        return {size: bin(self._piece_bits[first + size.value - 1]).count("1") for size in PieceSize}
     
     def is_board_full(self) -> bool:
         """Check if the board is full (no empty positions)."""
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.is_position_empty(row, col):
-                    return False
-        return True
+        # Every cell's occupied bit is set in the packed top grid
+        return self._top_u64 & self._occupied_mask == self._occupied_mask
     
     def get_valid_moves_for_new_piece(self, color: PieceColor, piece_size: PieceSize) -> List[Tuple[int, int]]:
         """
@@ -237,6 +443,75 @@ class Board:
         
         return valid_moves
     
+    def get_valid_targets(self, color: PieceColor) -> Tuple[Dict[PieceSize, List[Tuple[int, int]]],
+                                                            Dict[PieceSize, List[Tuple[int, int]]]]:
+        """
+        Get the valid positions for new and existing pieces of every size in one pass.
+        
+        Equivalent to calling get_valid_moves_for_new_piece and
+        get_valid_moves_for_existing_piece for each size, without rescanning
+        the board per size.
+        
+        Args:
+            color: The color of the pieces to place or move
+        
+        Returns:
+            Tuple of (new piece positions by size, existing piece positions by size)
+        """
+        state = self._top_u64
+        color_index = _COLOR_INDEX[color]
+        opponent_index = 1 - color_index
+        
+        # New pieces may only cover opponent pieces on a line with three opponent tops
+        blocking = 0
+        for counts, line_mask in zip(self._line_counts, self._line_masks):
+            if counts[opponent_index] == 3:
+                blocking |= line_mask
+        
+        empty = empty_mask(state, self.size)
+        empty_cells = mask_cells(empty, self.size)
+        new_targets = {}
+        existing_targets = {}
+        for piece_size in PieceSize:
+            cover = cover_mask(state, color_index, piece_size.value, self.size)
+            existing_targets[piece_size] = mask_cells(empty | cover, self.size) if cover else list(empty_cells)
+            new_targets[piece_size] = (mask_cells(empty | (cover & blocking), self.size)
+                                       if cover & blocking else list(empty_cells))
+        
+        return new_targets, existing_targets
+    
+    def valid_moves_mask(self, color: PieceColor, piece_size: PieceSize) -> int:
+        """
+        Get the cells a piece already on the board could move to, as a mask.
+        
+        The mask uses the packed top grid layout (see bitboard): the
+        occupied bit of every empty cell and of every opponent cell whose
+        top piece is smaller than piece_size is set.
+        
+        Args:
+            color: The color of the piece to move
+            piece_size: The size of the piece to move
+            
+        Returns:
+            Cell mask of valid destinations
+        """
+        return valid_move_mask(self._top_u64, _COLOR_INDEX[color], piece_size.value, self.size)
+    
+    def get_valid_moves(self, color: PieceColor) -> List[Tuple[int, int]]:
+        """
+        Get every position a piece of the given color could move to.
+        
+        A large piece can reach every cell any smaller piece can, so this
+        decodes the large-piece mask.
+        
+        Args:
+            color: The color of the piece to move
+            
+        Returns:
+            List of (row, col) positions, row-major
+        """
+        return mask_cells(self.valid_moves_mask(color, PieceSize.LARGE), self.size)
+    
     def get_moveable_pieces(self, color: PieceColor) -> List[Tuple[int, int]]:
         """
         Get positions of pieces that can be moved by the given color.
@@ -256,16 +531,143 @@ class Board:
         
         return moveable
     
+    def make_move(self, piece: Piece, row: int, col: int,
+                  is_new_piece: Optional[bool] = None) -> Optional[Tuple[Piece, Optional[Tuple[int, int]], int, int]]:
+        """
+        Apply a trial move in place so it can be reverted with undo_move.
+        
+        If the piece is on the board it is lifted from its current position
+        first, so covered pieces there are revealed exactly as in a real move.
+        
+        Args:
+            piece: The piece to place or move
+            row: Target row
+            col: Target column
+            is_new_piece: Placement rules to apply; defaults to whether the
+                piece is currently off the board
+            
+        Returns:
+            An undo token, or None if the move is not legal (board unchanged)
+        """
+        origin = piece.position
+        if is_new_piece is None:
+            is_new_piece = origin is None
+        
+        if origin is not None:
+            from_row, from_col = origin
+            if self.get_top_piece(from_row, from_col) is not piece:
+                return None
+            self.remove_piece(from_row, from_col)
+        
+        if not self.place_piece(piece, row, col, is_new_piece):
+            if origin is not None:
+                self._restore_piece(piece, from_row, from_col)
+            piece.position = origin
+            return None
+        
+        return (piece, origin, row, col)
+    
+    def undo_move(self, token: Tuple[Piece, Optional[Tuple[int, int]], int, int]) -> None:
+        """
+        Revert a move applied with make_move.
+        
+        Args:
+            token: The undo token returned by make_move
+        """
+        piece, origin, row, col = token
+        self.remove_piece(row, col)
+        
+        if origin is not None:
+            self._restore_piece(piece, origin[0], origin[1])
+        piece.position = origin
+    
+    def _restore_piece(self, piece: Piece, row: int, col: int) -> None:
+        """Put a piece back on top of a stack it was lifted from, bypassing placement rules."""
+        stack = self._stacks[row * self.size + col]
+        previous_top = stack[-1] if stack else None
+        stack.append(piece)
+        self._toggle_piece(piece, row, col)
+        self._set_top_nibble(row, col, piece)
+        self._update_lines(row, col, previous_top, piece)
+    
+    def _set_top_nibble(self, row: int, col: int, top_piece: Optional[Piece]) -> None:
+        """Store a cell's top piece in _top_u64 as (color << 3) | (size << 1) | occupied."""
+        shift = (row * self.size + col) * NIBBLE_BITS
+        nibble = 0
+        if top_piece is not None:
+            # Nibble layout as described in the bitboard module
+            nibble = ((top_piece._color_index << COLOR_SHIFT) |
+                      (top_piece._size_value << SIZE_SHIFT) | OCCUPIED)
+        self._top_u64 = (self._top_u64 & ~(NIBBLE_MASK << shift)) | (nibble << shift)
+    
+    def _update_lines(self, row: int, col: int, old_top: Optional[Piece], new_top: Optional[Piece]) -> None:
+        """Update the per-line color counts after the top piece of a cell changes."""
+        if old_top is not None and new_top is not None and old_top._color_index == new_top._color_index:
+            return
+        
+        size = self.size
+        line_counts = self._line_counts
+        full_lines = self._full_lines
+        lines_through = self._lines_through[row * size + col]
+        if old_top is not None:
+            color_index = old_top._color_index
+            for line_id in lines_through:
+                counts = line_counts[line_id]
+                if counts[color_index] == size:
+                    full_lines[color_index] -= 1
+                counts[color_index] -= 1
+        if new_top is not None:
+            color_index = new_top._color_index
+            for line_id in lines_through:
+                counts = line_counts[line_id]
+                counts[color_index] += 1
+                if counts[color_index] == size:
+                    full_lines[color_index] += 1
+    
+    def _toggle_piece(self, piece: Piece, row: int, col: int) -> None:
+        """Add or remove a piece at a position in the Zobrist hash and the piece bitboards."""
+        cell = row * self.size + col
+        kind = piece._color_index * 3 + piece._size_value - 1  # (color, size) index
+        self.zobrist ^= self._zobrist_keys[cell * 6 + kind]
+        self._piece_bits[kind] ^= 1 << cell
+    
+    def __eq__(self, other: object) -> bool:
+        """Boards are equal if every stack holds the same colors and sizes."""
+        if not isinstance(other, Board):
+            return NotImplemented
+        # Stacks grow in strictly increasing size, so the cells holding each
+        # (color, size) pin down every stack exactly
+        return self.size == other.size and self._piece_bits == other._piece_bits
+    
+    def __hash__(self) -> int:
+        """Hash the board by its packed top grid and Zobrist hash."""
+        return hash((self._top_u64, self.zobrist))
+    
     def copy(self) -> 'Board':
-        """Create a deep copy of the board."""
-        new_board = Board(self.size)
-        for row in range(self.size):
-            for col in range(self.size):
-                for piece in self.positions[row][col].pieces:
-                    # Create a copy of the piece
+        """
+        Create a deep copy of the board.
+        
+        The packed state, bitboards and line counts are copied directly and
+        the cached tables shared, rather than replaying every placement.
+        Pieces are copied so the two boards stay independent.
+        """
+        new_board = copy.copy(self)
+        new_board._piece_bits = list(self._piece_bits)
+        new_board._line_counts = [list(counts) for counts in self._line_counts]
+        new_board._full_lines = list(self._full_lines)
+        
+        new_board._cells = [BoardPosition() for _ in range(self.size * self.size)]
+        for cell, position in enumerate(self._cells):
+            if position.pieces:
+                coords = divmod(cell, self.size)
+                stack = new_board._cells[cell].pieces
+                for piece in position.pieces:
                     new_piece = Piece(piece.color, piece.size, piece.piece_id)
-                    # When copying, we treat pieces as existing pieces (not new)
-                    new_board.place_piece(new_piece, row, col, is_new_piece=False)
+                    new_piece.position = coords
+                    stack.append(new_piece)
+        new_board.positions = [new_board._cells[row * self.size:(row + 1) * self.size]
+                               for row in range(self.size)]
+        new_board._stacks = [position.pieces for position in new_board._cells]
         
         return new_board
     
@@ -286,13 +688,13 @@ class Board:
         Returns:
             True if placement is valid according to Gobblet rules
         """
-        position = self.positions[row][col]
+        stack = self._stacks[row * self.size + col]
         
         # If position is empty, always valid
-        if position.is_empty():
+        if not stack:
             return True
         
-        top_piece = position.top_piece()
+        top_piece = stack[-1]
         
         # Can't place on your own piece
         if top_piece.color == piece.color:
@@ -327,84 +729,18 @@ class Board:
         Returns:
             True if this position is part of a 3-in-a-row threat
         """
-        # Check all possible lines through this position
-        lines_to_check = []
-        
-        # Horizontal line
-        lines_to_check.append([(row, c) for c in range(self.size)])
-        
-        # Vertical line  
-        lines_to_check.append([(r, col) for r in range(self.size)])
-        
-        # Main diagonal (if position is on it)
-        if row == col:
-            lines_to_check.append([(i, i) for i in range(self.size)])
-        
-        # Anti-diagonal (if position is on it)
-        if row + col == self.size - 1:
-            lines_to_check.append([(i, self.size - 1 - i) for i in range(self.size)])
+        stack = self._stacks[row * self.size + col]
+        if not stack or stack[-1].color != opponent_color:
+            return False
         
-        # Check each line for 3-in-a-row threat
-        for line in lines_to_check:
-            if self._line_has_three_in_row_threat(line, opponent_color, (row, col)):
+        # Check the lines through this position for exactly 3 opponent pieces
+        color_index = _COLOR_INDEX[opponent_color]
+        for line_id in self._lines_through[row * self.size + col]:
+            if self._line_counts[line_id][color_index] == 3:
                 return True
         
         return False
     
-    def _line_has_three_in_row_threat(self, line: List[Tuple[int, int]], 
-                                     opponent_color: PieceColor, 
-                                     target_pos: Tuple[int, int]) -> bool:
-        """
-        Check if a line has exactly 3 opponent pieces in a row, with target_pos being one of them.
-        
-        Args:
-            line: List of positions forming a line
-            opponent_color: Opponent's color
-            target_pos: The position we're considering covering
-            
-        Returns:
-            True if line has 3-in-a-row threat including target_pos
-        """
-        opponent_count = 0
-        target_pos_has_opponent = False
-        
-        for pos in line:
-            r, c = pos
-            top_piece = self.get_top_piece(r, c)
-            
-            if top_piece and top_piece.color == opponent_color:
-                opponent_count += 1
-                if pos == target_pos:
-                    target_pos_has_opponent = True
-        
-        # Must have exactly 3 opponent pieces, and target position must be one of them
-        return opponent_count == 3 and target_pos_has_opponent
-    
-    def _check_line(self, positions: List[Tuple[int, int]]) -> Optional[PieceColor]:
-        """
-        Check if a line of positions has a winner.
-        
-        Args:
-            positions: List of (row, col) positions to check
-            
-        Returns:
-            The winning color, or None if no winner
-        """
-        if len(positions) < self.size:
-            return None
-        
-        first_piece = self.get_top_piece(positions[0][0], positions[0][1])
-        if not first_piece:
-            return None
-        
-        color = first_piece.color
-        for row, col in positions[1:]:
-            piece = self.get_top_piece(row, col)
-            if not piece or piece.color != color:
-                return None
-        
-        return color
-    
     def __str__(self) -> str:
         """String representation of the board."""
         result = []
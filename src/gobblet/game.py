@@ -13,7 +13,8 @@ from .piece import Piece
 class GobbletGame:
     """Main game class for Gobblet."""
     
-    def __init__(self, light_player: Player, dark_player: Player, board_size: int = 4):
+    def __init__(self, light_player: Player, dark_player: Player, board_size: int = 4,
+                 game_id: Optional[str] = None):
         """
         Initialize a new game.
         
@@ -21,8 +22,9 @@ class GobbletGame:
             light_player: Player playing with light pieces
             dark_player: Player playing with dark pieces
             board_size: Size of the board (default 4x4)
+            game_id: Identifier for the game record (default: a new UUID)
         """
-        self.game_id = str(uuid.uuid4())
+        self.game_id = game_id if game_id is not None else str(uuid.uuid4())
         self.board = Board(board_size)
         self.light_player = light_player
         self.dark_player = dark_player
@@ -123,7 +125,7 @@ class GobbletGame:
             return False
         
         # Verify piece belongs to current player
-        if piece not in self.current_player.pieces:
+        if not self.current_player.owns(piece):
             return False
         
         # Verify piece is available (not on board)
@@ -160,7 +162,7 @@ class GobbletGame:
             return False
         
         # Verify piece belongs to current player
-        if piece not in self.current_player.pieces:
+        if not self.current_player.owns(piece):
             return False
         
         # Verify piece is at the from_position
@@ -2,64 +2,293 @@
 Move tracking and storage for Gobblet game.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 import json
+import os
+import time
 from .piece import Piece, PieceColor, PieceSize
 
 
 @dataclass
 class Move:
     """Represents a single move in the game."""
+    __slots__ = ("player_color", "move_type", "piece_id", "piece_size", "from_row", "from_col",
+                 "to_row", "to_col", "captured_piece_id", "move_number", "timestamp", "_serialized")
     player_color: PieceColor
     move_type: str  # "place", "move"
     piece_id: int
     piece_size: PieceSize
-    from_position: Optional[Tuple[int, int]]  # None for new pieces
-    to_position: Tuple[int, int]
+    from_row: int  # -1 for new pieces
+    from_col: int  # -1 for new pieces
+    to_row: int
+    to_col: int
     captured_piece_id: Optional[int]  # ID of piece that was covered
     move_number: int
     timestamp: datetime
     
+    def __post_init__(self):
+        """Start without a serialized form."""
+        # Serialized form, built once; moves are never mutated after recording.
+        # A plain slot rather than a field, so it stays out of repr and ==
+        self._serialized: Optional[Dict[str, Any]] = None
+    
+    def __reduce__(self):
+        """Pickle as the constructor arguments only, without field names or the serialized cache."""
+        return (Move, (self.player_color, self.move_type, self.piece_id, self.piece_size,
+                       self.from_row, self.from_col, self.to_row, self.to_col,
+                       self.captured_piece_id, self.move_number, self.timestamp))
+    
+    @property
+    def from_position(self) -> Optional[Tuple[int, int]]:
+        """Starting (row, col) position, or None for new pieces."""
+        if self.from_row < 0:
+            return None
+        return (self.from_row, self.from_col)
+    
+    @property
+    def to_position(self) -> Tuple[int, int]:
+        """Ending (row, col) position."""
+        return (self.to_row, self.to_col)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert move to dictionary for serialization."""
-        return {
+        """
+        Convert move to dictionary for serialization.
+        
+        The dictionary is cached on the move, since GameDataManager re-exports
+        every stored game on each save. Treat the result as read-only.
+        """
+        if self._serialized is not None:
+            return self._serialized
+        
+        self._serialized = {
             "player_color": self.player_color.value,
             "move_type": self.move_type,
             "piece_id": self.piece_id,
             "piece_size": self.piece_size.value,
-            "from_position": self.from_position,
-            "to_position": self.to_position,
+            "from_position": [self.from_row, self.from_col] if self.from_row >= 0 else None,
+            "to_position": [self.to_row, self.to_col],
             "captured_piece_id": self.captured_piece_id,
             "move_number": self.move_number,
             "timestamp": self.timestamp.isoformat()
         }
+        return self._serialized
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Move':
         """Create move from dictionary."""
+        from_row, from_col = data["from_position"] if data["from_position"] else (-1, -1)
+        to_row, to_col = data["to_position"]
         return cls(
             player_color=PieceColor(data["player_color"]),
             move_type=data["move_type"],
             piece_id=data["piece_id"],
             piece_size=PieceSize(data["piece_size"]),
-            from_position=tuple(data["from_position"]) if data["from_position"] else None,
-            to_position=tuple(data["to_position"]),
+            from_row=from_row,
+            from_col=from_col,
+            to_row=to_row,
+            to_col=to_col,
             captured_piece_id=data["captured_piece_id"],
             move_number=data["move_number"],
             timestamp=datetime.fromisoformat(data["timestamp"])
         )
 
 
+class LazyMoves(Sequence):
+    """Read-only move list that parses raw move dictionaries on first access."""
+    
+    def __init__(self, raw_moves: List[Dict[str, Any]]):
+        """
+        Initialize the lazy move list.
+        
+        Args:
+            raw_moves: Serialized moves as produced by Move.to_dict
+        """
+        self._raw_moves = raw_moves
+        self._moves: Optional[List[Move]] = None
+    
+    @property
+    def is_materialized(self) -> bool:
+        """Check if the raw moves have been parsed."""
+        return self._moves is not None
+    
+    def materialize(self) -> List[Move]:
+        """
+        Parse the raw moves into Move objects.
+        
+        Returns:
+            List of parsed moves
+        """
+        if self._moves is None:
+            self._moves = [Move.from_dict(move_data) for move_data in self._raw_moves]
+        return self._moves
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Get the serialized moves, without parsing them if not yet needed."""
+        if self._moves is None:
+            return self._raw_moves
+        return [move.to_dict() for move in self._moves]
+    
+    def __len__(self) -> int:
+        """Number of moves, known without parsing."""
+        return len(self._raw_moves)
+    
+    def __getitem__(self, index):
+        """Get a move (or slice of moves), parsing on first access."""
+        return self.materialize()[index]
+    
+    def __iter__(self) -> Iterator[Move]:
+        """Iterate over the parsed moves."""
+        return iter(self.materialize())
+
+
+class PackedMoves(LazyMoves):
+    """
+    Append-only move list stored as small ints, building Move objects on first access.
+    
+    Each move takes FIELDS_PER_MOVE slots of a flat int16 array: color index,
+    move type index, piece id, piece size, from row, from col, to row, to col
+    and captured piece id, with -1 for a missing position or capture.
+    Timestamps are kept alongside as epoch seconds.
+    """
+    
+    FIELDS_PER_MOVE = 9
+    _COLORS = (PieceColor.LIGHT, PieceColor.DARK)
+    _MOVE_TYPES = ("place", "move")
+    
+    def __init__(self, fields: Optional[array] = None, timestamps: Optional[array] = None):
+        """
+        Initialize the packed move list.
+        
+        Args:
+            fields: Packed move fields (default: empty)
+            timestamps: Epoch timestamp per move (default: empty)
+        """
+        self._fields = fields if fields is not None else array('h')
+        self._timestamps = timestamps if timestamps is not None else array('d')
+        self._moves: Optional[List[Move]] = None
+        self._dicts: Optional[List[Dict[str, Any]]] = None
+    
+    def __reduce__(self):
+        """Pickle as the packed arrays only, without the parsed caches."""
+        return (PackedMoves, (self._fields, self._timestamps))
+    
+    def append(self, color: PieceColor, move_type: str, piece_id: int, piece_size: PieceSize,
+               from_row: int, from_col: int, to_row: int, to_col: int,
+               captured_piece_id: Optional[int], timestamp: float) -> None:
+        """
+        Append a move.
+        
+        Args:
+            color: Color of the player making the move
+            move_type: Type of move ("place" or "move")
+            piece_id: ID of the moved piece
+            piece_size: Size of the moved piece
+            from_row: Starting row (-1 for new pieces)
+            from_col: Starting column (-1 for new pieces)
+            to_row: Ending row
+            to_col: Ending column
+            captured_piece_id: ID of the covered piece, or None
+            timestamp: Time of the move in epoch seconds
+        """
+        self._fields.extend((
+            0 if color == PieceColor.LIGHT else 1,
+            self._MOVE_TYPES.index(move_type),
+            piece_id,
+            piece_size.value,
+            from_row, from_col, to_row, to_col,
+            -1 if captured_piece_id is None else captured_piece_id
+        ))
+        self._timestamps.append(timestamp)
+        self._moves = None
+        self._dicts = None
+    
+    def copy(self) -> 'PackedMoves':
+        """Get an independent snapshot of the moves so far."""
+        return PackedMoves(array('h', self._fields), array('d', self._timestamps))
+    
+    def _unpacked(self) -> Iterator[Tuple[int, ...]]:
+        """Yield (move_number, *fields, timestamp) per move."""
+        step = self.FIELDS_PER_MOVE
+        for index, timestamp in enumerate(self._timestamps):
+            yield (index + 1, *self._fields[index * step:(index + 1) * step], timestamp)
+    
+    def materialize(self) -> List[Move]:
+        """
+        Build Move objects from the packed fields.
+        
+        Returns:
+            List of moves
+        """
+        if self._moves is None:
+            self._moves = [
+                Move(
+                    player_color=self._COLORS[color_index],
+                    move_type=self._MOVE_TYPES[type_index],
+                    piece_id=piece_id,
+                    piece_size=PieceSize(size_value),
+                    from_row=from_row,
+                    from_col=from_col,
+                    to_row=to_row,
+                    to_col=to_col,
+                    captured_piece_id=captured if captured >= 0 else None,
+                    move_number=move_number,
+                    timestamp=datetime.fromtimestamp(timestamp)
+                )
+                for (move_number, color_index, type_index, piece_id, size_value,
+                     from_row, from_col, to_row, to_col, captured, timestamp) in self._unpacked()
+            ]
+        return self._moves
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Get the serialized moves, built straight from the packed fields."""
+        if self._moves is not None:
+            return [move.to_dict() for move in self._moves]
+        
+        if self._dicts is None:
+            self._dicts = [
+                {
+                    "player_color": self._COLORS[color_index].value,
+                    "move_type": self._MOVE_TYPES[type_index],
+                    "piece_id": piece_id,
+                    "piece_size": size_value,
+                    "from_position": [from_row, from_col] if from_row >= 0 else None,
+                    "to_position": [to_row, to_col],
+                    "captured_piece_id": captured if captured >= 0 else None,
+                    "move_number": move_number,
+                    "timestamp": datetime.fromtimestamp(timestamp).isoformat()
+                }
+                for (move_number, color_index, type_index, piece_id, size_value,
+                     from_row, from_col, to_row, to_col, captured, timestamp) in self._unpacked()
+            ]
+        return self._dicts
+    
+    def __len__(self) -> int:
+        """Number of moves, known without building them."""
+        return len(self._timestamps)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare packed fields directly, or move by move against another sequence."""
+        if isinstance(other, PackedMoves):
+            return self._fields == other._fields and self._timestamps == other._timestamps
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+
 @dataclass
 class GameRecord:
     """Represents a complete game record."""
+    __slots__ = ("game_id", "start_time", "end_time", "winner", "moves", "player_strategies",
+                 "total_moves", "game_duration_seconds")
     game_id: str
     start_time: datetime
     end_time: Optional[datetime]
     winner: Optional[PieceColor]
-    moves: List[Move]
+    moves: Union[List[Move], LazyMoves]  # PackedMoves for records of games just played
     player_strategies: Dict[PieceColor, str]
     total_moves: int
     game_duration_seconds: Optional[float]
@@ -71,7 +300,8 @@ class GameRecord:
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "winner": self.winner.value if self.winner else None,
-            "moves": [move.to_dict() for move in self.moves],
+            "moves": (self.moves.to_dicts() if isinstance(self.moves, LazyMoves)
+                      else [move.to_dict() for move in self.moves]),
             "player_strategies": {color.value: strategy for color, strategy in self.player_strategies.items()},
             "total_moves": self.total_moves,
             "game_duration_seconds": self.game_duration_seconds
@@ -90,6 +320,36 @@ class GameRecord:
             total_moves=data["total_moves"],
             game_duration_seconds=data["game_duration_seconds"]
         )
+    
+    @classmethod
+    def from_dict_meta(cls, data: Dict[str, Any]) -> 'GameRecord':
+        """
+        Create game record from dictionary, deferring move parsing.
+        
+        Winner, timing and counts are available immediately; the moves are
+        parsed the first time they are accessed (or via materialize_moves).
+        """
+        return cls(
+            game_id=data["game_id"],
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(data["end_time"]) if data["end_time"] else None,
+            winner=PieceColor(data["winner"]) if data["winner"] else None,
+            moves=LazyMoves(data["moves"]),
+            player_strategies={PieceColor(color): strategy for color, strategy in data["player_strategies"].items()},
+            total_moves=data["total_moves"],
+            game_duration_seconds=data["game_duration_seconds"]
+        )
+    
+    def materialize_moves(self) -> List[Move]:
+        """
+        Parse any deferred moves into Move objects.
+        
+        Returns:
+            The list of moves
+        """
+        if isinstance(self.moves, LazyMoves):
+            self.moves = self.moves.materialize()
+        return self.moves
 
 
 class MoveTracker:
@@ -103,7 +363,7 @@ class MoveTracker:
             game_id: Unique identifier for the game
         """
         self.game_id = game_id
-        self.moves: List[Move] = []
+        self.moves: PackedMoves = PackedMoves()
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
         self.winner: Optional[PieceColor] = None
@@ -129,20 +389,21 @@ class MoveTracker:
             captured_piece: Piece that was captured/covered
         """
         self.move_counter += 1
+        from_row, from_col = from_position if from_position else (-1, -1)
+        to_row, to_col = to_position
         
-        move = Move(
-            player_color=player_color,
-            move_type=move_type,
-            piece_id=piece.piece_id,
-            piece_size=piece.size,
-            from_position=from_position,
-            to_position=to_position,
-            captured_piece_id=captured_piece.piece_id if captured_piece else None,
-            move_number=self.move_counter,
-            timestamp=datetime.now()
+        self.moves.append(
+            player_color,
+            move_type,
+            piece.piece_id,
+            piece.size,
+            from_row,
+            from_col,
+            to_row,
+            to_col,
+            captured_piece.piece_id if captured_piece else None,
+            time.time()
         )
-        
-        self.moves.append(move)
     
     def set_player_strategy(self, color: PieceColor, strategy: str) -> None:
         """
@@ -251,6 +512,11 @@ class GameDataManager:
         """
         self.data_file = data_file
         self.games: List[GameRecord] = []
+        
+        # How many of self.games the data file holds, and its size after our
+        # last write; saves append to the file while it still matches
+        self._saved_count = 0
+        self._saved_size: Optional[int] = None
     
     def save_game(self, game_record: GameRecord) -> None:
         """
@@ -260,7 +526,17 @@ class GameDataManager:
             game_record: The game record to save
         """
         self.games.append(game_record)
-        self._save_to_file()
+        self._save_to_file([game_record])
+    
+    def save_games(self, game_records: List[GameRecord]) -> None:
+        """
+        Save several game records with a single file write.
+        
+        Args:
+            game_records: The game records to save
+        """
+        self.games.extend(game_records)
+        self._save_to_file(game_records)
     
     def load_games(self) -> List[GameRecord]:
         """
@@ -272,7 +548,9 @@ class GameDataManager:
         try:
             with open(self.data_file, 'r') as f:
                 data = json.load(f)
-                self.games = [GameRecord.from_dict(record) for record in data]
+                self.games = [GameRecord.from_dict_meta(record) for record in data]
+            self._saved_count = len(self.games)
+            self._saved_size = os.path.getsize(self.data_file)
         except FileNotFoundError:
             self.games = []
         except json.JSONDecodeError:
@@ -307,17 +585,64 @@ class GameDataManager:
         return [game for game in self.games 
                 if color in game.player_strategies and game.player_strategies[color] == strategy]
     
-    def _save_to_file(self) -> None:
-        """Save games to file."""
+    def _save_to_file(self, new_records: List[GameRecord]) -> None:
+        """
+        Save games to file.
+        
+        While the file still holds exactly the games saved before, the new
+        records are spliced in before its closing bracket instead of
+        rewriting every game; otherwise the whole list is written out.
+        
+        Args:
+            new_records: The records just added to self.games
+        """
         try:
-            import os
             os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
             
-            with open(self.data_file, 'w') as f:
-                json.dump([game.to_dict() for game in self.games], f, indent=2)
+            saved_before = len(self.games) - len(new_records)
+            appended = (saved_before > 0 and saved_before == self._saved_count
+                        and self._file_size() == self._saved_size
+                        and self._append_to_file(new_records))
+            if not appended:
+                with open(self.data_file, 'w') as f:
+                    json.dump([game.to_dict() for game in self.games], f, indent=2)
+            
+            self._saved_count = len(self.games)
+            self._saved_size = self._file_size()
         except Exception as e:
+            self._saved_count = 0
             print(f"Error saving games to {self.data_file}: {e}")
     
+    def _append_to_file(self, new_records: List[GameRecord]) -> bool:
+        """
+        Add records to the end of a non-empty saved list, formatted as json.dump(..., indent=2) would.
+        
+        Args:
+            new_records: The records to append
+            
+        Returns:
+            True if the records were appended, False if the file did not end as expected
+        """
+        if not new_records:
+            return True
+        
+        # Serialize as a list and drop its brackets, keeping the item indentation
+        items = json.dumps([game.to_dict() for game in new_records], indent=2)[1:-2]
+        with open(self.data_file, 'r+b') as f:
+            f.seek(-2, os.SEEK_END)
+            if f.read(2) != b"\n]":
+                return False
+            f.seek(-2, os.SEEK_END)
+            f.write(f",{items}\n]".encode())
+        return True
+    
+    def _file_size(self) -> Optional[int]:
+        """Get the data file's size, or None if it does not exist."""
+        try:
+            return os.path.getsize(self.data_file)
+        except OSError:
+            return None
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get overall statistics from all games.
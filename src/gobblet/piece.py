@@ -22,6 +22,8 @@ class PieceColor(Enum):
 class Piece:
     """Represents a Gobblet piece."""
     
+    __slots__ = ("color", "size", "piece_id", "position", "_size_value", "_color_index")
+    
     def __init__(self, color: PieceColor, size: PieceSize, piece_id: int):
         """
         Initialize a piece.
@@ -35,6 +37,8 @@ class Piece:
         self.size = size
         self.piece_id = piece_id
         self.position: Optional[tuple] = None  # (row, col) on board, None if off-board
+        self._size_value = size.value  # Plain int so can_cover avoids enum lookups
+        self._color_index = 0 if color == PieceColor.LIGHT else 1  # 0 light, 1 dark, as in the board encoding
     
     def can_cover(self, other_piece: 'Piece') -> bool:
         """
@@ -46,7 +50,7 @@ class Piece:
         Returns:
             True if this piece can cover the other piece
         """
-        return self.size.value > other_piece.size.value
+        return self._size_value > other_piece._size_value
     
     def __str__(self) -> str:
         """String representation of the piece."""
@@ -3,15 +3,134 @@ Player classes for Gobblet game.
 """
 
 import random
+import time
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict, Any, Iterator
 from .piece import Piece, PieceColor, PieceSize
 from .board import Board
 
 
+# Search scores: a win is worth WIN_SCORE plus the plies left when it happens
+WIN_SCORE = 1000
+SEARCH_INFINITY = 10 * WIN_SCORE
+
+# Transposition table entry bounds
+_TT_EXACT, _TT_LOWER, _TT_UPPER = 0, 1, 2
+
+_OPPONENT_COLOR = {PieceColor.LIGHT: PieceColor.DARK, PieceColor.DARK: PieceColor.LIGHT}
+
+# Sort keys for piece sizes, looked up once per piece
+_SIZE_ORDER = {size: size.value for size in PieceSize}
+
+
+@lru_cache(maxsize=None)
+def _center_order(size: int) -> Tuple[Tuple[int, int], ...]:
+    """Get positions within reach of the center, closest first (raster order within a distance)."""
+    center = size // 2
+    
+    def distance(position: Tuple[int, int]) -> int:
+        return abs(position[0] - center) + abs(position[1] - center)
+    
+    positions = [(row, col) for row in range(size) for col in range(size)]
+    return tuple(sorted((pos for pos in positions if distance(pos) <= center), key=distance))
+
+
+def _iter_strategic_positions(size: int):
+    """Yield corners, then center, then non-corner edge positions (may repeat for tiny boards)."""
+    last = size - 1
+    
+    # Corners first
+    yield from ((0, 0), (0, last), (last, 0), (last, last))
+    
+    # Center positions
+    center = size // 2
+    if size % 2 == 1:
+        yield (center, center)
+    else:
+        yield from ((center-1, center-1), (center-1, center), (center, center-1), (center, center))
+    
+    # Edges, skipping the corners already emitted
+    for i in range(1, last):
+        yield from ((0, i), (last, i), (i, 0), (i, last))
+
+
+@lru_cache(maxsize=None)
+def _strategic_order(size: int) -> Tuple[Tuple[int, int], ...]:
+    """Get positions in order of strategic importance: corners, center, then edges."""
+    # dict.fromkeys removes duplicates while preserving order
+    return tuple(dict.fromkeys(_iter_strategic_positions(size)))
+
+
+def _candidate_move(piece: Piece, from_position: Optional[Tuple[int, int]],
+                    to_position: Tuple[int, int]) -> Tuple[str, Dict[str, Any]]:
+    """Turn a (piece, from_position, to_position) candidate into a move tuple."""
+    if from_position is None:
+        return ("place", {"piece": piece, "position": to_position})
+    
+    return ("move", {
+        "piece": piece,
+        "from_position": from_position,
+        "to_position": to_position
+    })
+
+
+def _pick_candidate(options: List[Tuple[Piece, Optional[Tuple[int, int]], List[Tuple[int, int]]]],
+                    rng=random) -> Optional[Tuple[Piece, Optional[Tuple[int, int]], Tuple[int, int]]]:
+    """
+    Pick a uniformly random candidate from (piece, from_position, targets) groups.
+    
+    Draws a single index over all targets instead of flattening the groups;
+    randrange draws the same number random.choice would over the full list,
+    so seeded games play out the same either way.
+    
+    Args:
+        options: Groups of valid targets per piece
+        rng: Random generator to draw from (default: the shared module one)
+        
+    Returns:
+        A (piece, from_position, to_position) candidate, or None if there are no targets
+    """
+    total = sum(len(targets) for _, _, targets in options)
+    if not total:
+        return None
+    
+    index = rng.randrange(total)
+    for piece, from_position, targets in options:
+        if index < len(targets):
+            return (piece, from_position, targets[index])
+        index -= len(targets)
+
+
+def _random_move(player: 'Player', board: Board, rng=random) -> Tuple[str, Dict[str, Any]]:
+    """
+    Choose a uniformly random valid move for a player, using its own pieces.
+    
+    Args:
+        player: The player to move
+        board: Current board state
+        rng: Random generator to draw from (default: the shared module one)
+        
+    Returns:
+        Tuple of (move_type, move_data), with a None piece if no move exists
+    """
+    # Only the chosen candidate is turned into a move dict
+    candidate = _pick_candidate(player._candidate_groups(board), rng)
+    if candidate is None:
+        # No valid moves available
+        return ("place", {"piece": None, "position": None})
+    
+    return _candidate_move(*candidate)
+
+
 class Player(ABC):
     """Abstract base class for all players."""
     
+    PIECES_PER_SIZE = 3
+    search_depth = 0  # Plies of lookahead used to check heuristic moves (0 = none)
+    MAX_SEARCH_DEPTH = 8  # Deepest iteration of choose_move_time_limited
+    TT_MAX_ENTRIES = 100_000
+    
     def __init__(self, color: PieceColor, name: str):
         """
         Initialize the player.
@@ -25,6 +144,12 @@ class Player(ABC):
         self.pieces: List[Piece] = []
         self.strategy_name = "base"
         self._init_pieces()
+        
+        # Transposition table: (zobrist, side to move) -> (depth, score, flag, best_move)
+        self._tt: Dict[Tuple[int, PieceColor], Tuple[int, int, int, Optional[Tuple]]] = {}
+        
+        # Stand-in pieces for trial moves, keyed by (color, size, index); see _probe
+        self._probes: Dict[Tuple[PieceColor, PieceSize, int], Piece] = {}
     
     def _init_pieces(self) -> None:
         """Initialize the player's pieces."""
@@ -32,9 +157,16 @@ class Player(ABC):
         
         # Each player gets 3 pieces of each size (small, medium, large)
         for size in PieceSize:
-            for _ in range(3):
+            for _ in range(self.PIECES_PER_SIZE):
                 self.pieces.append(Piece(self.color, size, piece_id))
                 piece_id += 1
+        
+        # Set of ids for O(1) ownership checks against board pieces
+        self._piece_ids = {piece.piece_id for piece in self.pieces}
+    
+    def owns(self, piece: Piece) -> bool:
+        """Check whether a piece belongs to this player."""
+        return piece.piece_id in self._piece_ids
     
     def get_available_pieces(self) -> List[Piece]:
         """
@@ -56,14 +188,414 @@ class Player(ABC):
             List of (piece, position) tuples for pieces on the board
         """
         pieces_on_board = []
-        for row in range(board.size):
-            for col in range(board.size):
-                top_piece = board.get_top_piece(row, col)
-                if top_piece and top_piece in self.pieces:
-                    pieces_on_board.append((top_piece, (row, col)))
+        for row, board_row in enumerate(board.positions):
+            for col, position in enumerate(board_row):
+                stack = position.pieces
+                if stack and stack[-1].piece_id in self._piece_ids:
+                    pieces_on_board.append((stack[-1], (row, col)))
         
         return pieces_on_board
     
+    @staticmethod
+    def _first_of_each_size(pieces: List[Piece]) -> List[Piece]:
+        """
+        Keep the first piece of each size, smallest size first.
+        
+        Pieces of the same size and color behave identically wherever they
+        are placed, so probing one per size is enough.
+        """
+        first_available_of_size = {}
+        for piece in pieces:
+            first_available_of_size.setdefault(piece.size, piece)
+        return [first_available_of_size[size] for size in PieceSize if size in first_available_of_size]
+    
+    def _candidate_groups(self, board: Board
+                          ) -> List[Tuple[Piece, Optional[Tuple[int, int]], List[Tuple[int, int]]]]:
+        """
+        Get (piece, from_position, targets) for every piece, in _legal_candidates order.
+        
+        A piece's own cell is never among its targets, since only empty or
+        opponent cells are, so the groups flatten to exactly the legal moves.
+        """
+        new_moves_by_size, existing_moves_by_size = board.get_valid_targets(self.color)
+        return ([(piece, None, new_moves_by_size[piece.size]) for piece in self.get_available_pieces()]
+                + [(piece, current_pos, existing_moves_by_size[piece.size])
+                   for piece, current_pos in self.get_pieces_on_board(board)])
+    
+    def _legal_candidates(self, board: Board, available_pieces: Optional[List[Piece]] = None,
+                          pieces_on_board: Optional[List[Tuple[Piece, Tuple[int, int]]]] = None
+                          ) -> Iterator[Tuple[Piece, Optional[Tuple[int, int]], Tuple[int, int]]]:
+        """
+        Yield (piece, from_position, to_position) for every legal move.
+        
+        from_position is None for placements. Callers that already have the
+        piece lists can pass them in, e.g. deduplicated by size.
+        """
+        if available_pieces is None:
+            available_pieces = self.get_available_pieces()
+        if pieces_on_board is None:
+            pieces_on_board = self.get_pieces_on_board(board)
+        
+        # Valid positions only depend on piece size, so compute them for all sizes in one scan
+        new_moves_by_size, existing_moves_by_size = board.get_valid_targets(self.color)
+        
+        # Place moves for available pieces (using new Gobblet rules)
+        for piece in available_pieces:
+            for pos in new_moves_by_size[piece.size]:
+                yield (piece, None, pos)
+        
+        # Move moves for pieces on board (existing pieces have more flexibility)
+        for piece, current_pos in pieces_on_board:
+            for new_pos in existing_moves_by_size[piece.size]:
+                if new_pos != current_pos:
+                    yield (piece, current_pos, new_pos)
+    
+    def _find_quick_win(self, board: Board, available_pieces: List[Piece],
+                        pieces_on_board: List[Tuple[Piece, Tuple[int, int]]]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Look for a winning move on the cells that complete one of our lines.
+        
+        Only those cells are probed, smallest sufficient piece first, so the
+        common case returns after a handful of trial moves. Wins that come
+        from uncovering a piece elsewhere are left to the caller's full scan.
+        
+        Returns:
+            A winning move, or None if none was found on the candidate cells
+        """
+        available_pieces = sorted(available_pieces, key=lambda p: _SIZE_ORDER[p.size])
+        
+        for row, col, min_size in board.candidate_wincells(self.color):
+            for piece in available_pieces:
+                if piece.size.value >= min_size and self._probe_win(board, piece, row, col):
+                    return ("place", {"piece": piece, "position": (row, col)})
+            
+            for piece, current_pos in pieces_on_board:
+                if piece.size.value >= min_size and self._probe_win(board, piece, row, col):
+                    return ("move", {
+                        "piece": piece,
+                        "from_position": current_pos,
+                        "to_position": (row, col)
+                    })
+        
+        return None
+    
+    def _find_winning_move(self, board: Board) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Find a move that wins the game immediately."""
+        available_pieces = self._first_of_each_size(self.get_available_pieces())
+        pieces_on_board = self.get_pieces_on_board(board)
+        
+        quick_win = self._find_quick_win(board, available_pieces, pieces_on_board)
+        if quick_win:
+            return quick_win
+        
+        winning_moves = [(piece, from_position, (row, col))
+                         for piece, from_position, (row, col)
+                         in self._legal_candidates(board, available_pieces, pieces_on_board)
+                         if self._probe_win(board, piece, row, col)]
+        
+        # Return random winning move if multiple exist
+        return _candidate_move(*random.choice(winning_moves)) if winning_moves else None
+    
+    def _probe_win(self, board: Board, piece: Piece, row: int, col: int) -> bool:
+        """Check if placing/moving a piece to (row, col) wins."""
+        # A new piece only changes the lines through its cell, so on an
+        # undecided board the line counts answer directly
+        if piece.position is None and board.check_winner() is None:
+            return board.can_place(piece, row, col) and board.completes_line(self.color, row, col)
+        
+        # Moving a piece may uncover another one, so play it out and revert
+        token = board.make_move(piece, row, col)
+        if token is None:
+            return False
+        
+        won = board.wins_for(self.color)
+        board.undo_move(token)
+        return won
+    
+    def _negamax(self, board: Board, depth: int, alpha: int, beta: int,
+                 color: PieceColor) -> Tuple[int, Optional[Tuple]]:
+        """
+        Search the position with negamax and alpha-beta pruning.
+        
+        Moves are tried with make/undo on the board itself, and results are
+        kept in the transposition table (keyed by Zobrist hash and side to
+        move) so they carry over between turns.
+        
+        Args:
+            board: The game board
+            depth: Remaining depth in plies
+            alpha: Lower bound of the search window
+            beta: Upper bound of the search window
+            color: The side to move
+        
+        Returns:
+            Tuple of (score, best_move) where score is from color's point of
+            view and best_move is a (size, from_position, row, col) key, or
+            None if the position was not expanded
+        """
+        winner = board.check_winner()
+        if winner is not None:
+            # Prefer quicker wins and slower losses
+            return (WIN_SCORE + depth if winner == color else -WIN_SCORE - depth), None
+        if board.is_board_full():
+            return 0, None
+        if depth == 0:
+            return board.line_score(color), None
+        
+        key = (board.zobrist, color)
+        entry = self._tt.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, flag, tt_move = entry
+            if entry_depth >= depth:
+                if flag == _TT_EXACT:
+                    return value, tt_move
+                if flag == _TT_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, tt_move
+        
+        original_alpha = alpha
+        opponent_color = _OPPONENT_COLOR[color]
+        best_score, best_move = None, None
+        
+        for piece, row, col in self._ordered_moves(board, color, tt_move):
+            move_key = (piece.size, piece.position, row, col)
+            token = board.make_move(piece, row, col)
+            if token is None:
+                continue
+            
+            score = -self._negamax(board, depth - 1, -beta, -alpha, opponent_color)[0]
+            board.undo_move(token)
+            
+            if best_score is None or score > best_score:
+                best_score, best_move = score, move_key
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+        
+        # No legal move: the side to move loses, as in the game itself
+        if best_move is None:
+            return -WIN_SCORE - depth, None
+        
+        if best_score <= original_alpha:
+            flag = _TT_UPPER
+        elif best_score >= beta:
+            flag = _TT_LOWER
+        else:
+            flag = _TT_EXACT
+        
+        if len(self._tt) >= self.TT_MAX_ENTRIES:
+            self._tt.clear()
+        self._tt[key] = (depth, best_score, flag, best_move)
+        return best_score, best_move
+    
+    def _ordered_moves(self, board: Board, color: PieceColor,
+                       tt_move: Optional[Tuple]) -> List[Tuple[Piece, int, int]]:
+        """
+        Get the candidate (piece, row, col) moves for a side, best guesses first.
+        
+        The transposition table's best move comes first, then moves onto
+        cells that complete a line for the side, then cells that would block
+        the opponent. Board moves are not checked for legality here.
+        """
+        indices = range(board.size)
+        cells = [(row, col) for row in indices for col in indices]
+        moves = []
+        
+        # One off-board piece per size is enough, they are interchangeable
+        for piece in self._search_pieces(board, color):
+            for row, col in cells:
+                if board.can_place(piece, row, col):
+                    moves.append((piece, row, col))
+        
+        for from_row, board_row in enumerate(board.positions):
+            for from_col, position in enumerate(board_row):
+                stack = position.pieces
+                if stack and stack[-1].color == color:
+                    moves.extend((stack[-1], row, col) for row, col in cells
+                                 if (row, col) != (from_row, from_col))
+        
+        opponent_color = _OPPONENT_COLOR[color]
+        win_cells = {(row, col) for row, col, _ in board.candidate_wincells(color)}
+        block_cells = {(row, col) for row, col, _ in board.candidate_wincells(opponent_color)}
+        
+        def priority(move: Tuple[Piece, int, int]) -> int:
+            piece, row, col = move
+            if tt_move is not None and (piece.size, piece.position, row, col) == tt_move:
+                return 0
+            if (row, col) in win_cells:
+                return 1
+            if (row, col) in block_cells:
+                return 2
+            return 3
+        
+        moves.sort(key=priority)
+        return moves
+    
+    def _search_pieces(self, board: Board, color: PieceColor) -> List[Piece]:
+        """
+        Get one off-board piece per size that a side can still place.
+        
+        Our own pieces are used directly; the opponent's reserve is inferred
+        from what is on the board and stood in for by temporary pieces.
+        """
+        if color == self.color:
+            return self._first_of_each_size(self.get_available_pieces())
+        
+        # Probes placed higher up the search are still on the board and
+        # counted, so indexing by the count never hands one out twice
+        on_board = board.count_pieces(color)
+        return [self._probe(color, size, on_board[size]) for size in PieceSize
+                if on_board[size] < self.PIECES_PER_SIZE]
+    
+    def _probe(self, color: PieceColor, size: PieceSize, index: int = 0) -> Piece:
+        """
+        Get one of this player's temporary pieces (id -1) to try placements with.
+        
+        The same piece is handed out again for the same key, so it is only
+        valid until the next _probe() call with that key: it must be off the
+        board (undone) by then, and must not be kept in a move or elsewhere.
+        Pieces that are on the board together need distinct indices.
+        
+        Args:
+            color: The color of the piece
+            size: The size of the piece
+            index: Which of the temporary pieces of this color and size to use
+            
+        Returns:
+            An off-board piece
+        """
+        key = (color, size, index)
+        piece = self._probes.get(key)
+        if piece is None:
+            piece = self._probes[key] = Piece(color, size, -1)
+        return piece
+    
+    def _search_move(self, board: Board, depth: int) -> Tuple[int, Optional[Tuple[str, Dict[str, Any]]]]:
+        """
+        Run a full-width search and turn its best move into a move tuple.
+        
+        Args:
+            board: The game board
+            depth: Search depth in plies
+        
+        Returns:
+            Tuple of (score, move), with move None if no legal move was found
+        """
+        score, best_move = self._negamax(board, depth, -SEARCH_INFINITY, SEARCH_INFINITY, self.color)
+        if best_move is None:
+            return score, None
+        
+        size, from_position, row, col = best_move
+        if from_position is None:
+            piece = next(p for p in self._search_pieces(board, self.color) if p.size == size)
+            return score, ("place", {"piece": piece, "position": (row, col)})
+        
+        piece = board.get_top_piece(*from_position)
+        return score, ("move", {
+            "piece": piece,
+            "from_position": from_position,
+            "to_position": (row, col)
+        })
+    
+    def _loses_after(self, board: Board, move: Tuple[str, Dict[str, Any]], depth: int) -> bool:
+        """
+        Check whether the opponent can force a win within depth - 1 plies after a move.
+        
+        Args:
+            board: The game board
+            move: The candidate move tuple
+            depth: Total search depth, counting the candidate move itself
+        
+        Returns:
+            True if the search proves the move loses
+        """
+        move_type, move_data = move
+        piece = move_data["piece"]
+        row, col = move_data["position"] if move_type == "place" else move_data["to_position"]
+        
+        token = board.make_move(piece, row, col)
+        if token is None:
+            return False
+        
+        opponent_color = _OPPONENT_COLOR[self.color]
+        if depth - 1 <= 1 and not board.candidate_wincells(opponent_color):
+            # With a single reply the opponent can only win by completing a
+            # line it already holds all but one cell of
+            board.undo_move(token)
+            return False
+        
+        # A null window just above a plain win answers "does the opponent win?"
+        score = self._negamax(board, depth - 1, WIN_SCORE - 1, WIN_SCORE, opponent_color)[0]
+        board.undo_move(token)
+        return score >= WIN_SCORE
+    
+    def _checked_by_search(self, board: Board, move: Tuple[str, Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Keep a heuristic move unless the search shows it loses, else play the searched move.
+        
+        Args:
+            board: The game board
+            move: The move chosen by the heuristics
+        
+        Returns:
+            The move to play
+        """
+        if self.search_depth < 2 or move[1].get("piece") is None:
+            return move
+        if not self._loses_after(board, move, self.search_depth):
+            return move
+        
+        _, searched_move = self._search_move(board, self.search_depth)
+        return searched_move or move
+    
+    def choose_move_time_limited(self, board: Board, time_budget_ms: float) -> Tuple[str, Dict[str, Any]]:
+        """
+        Choose a move by iterative deepening within a wall-clock budget.
+        
+        Each iteration searches one ply deeper than the last, starting from
+        the best moves the shallower iterations left in the transposition
+        table. The budget is checked between iterations, and an iteration is
+        not started if the growth of the previous ones says it would overrun.
+        
+        Args:
+            board: Current board state
+            time_budget_ms: Time budget in milliseconds
+            
+        Returns:
+            The best move from the deepest completed iteration
+        """
+        start = time.perf_counter()
+        budget = time_budget_ms / 1000
+        best_move = None
+        previous_time = None
+        
+        for depth in range(1, self.MAX_SEARCH_DEPTH + 1):
+            iteration_start = time.perf_counter()
+            score, move = self._search_move(board, depth)
+            if move is not None:
+                best_move = move
+            
+            # A forced win or loss will not change with more depth
+            if abs(score) >= WIN_SCORE:
+                break
+            
+            now = time.perf_counter()
+            iteration_time = now - iteration_start
+            if now - start > budget:
+                break
+            
+            # Assume the next iteration grows by the same factor as this one did
+            growth = max(2.0, iteration_time / previous_time) if previous_time else 2.0
+            if now - start + iteration_time * growth > budget:
+                break
+            previous_time = max(iteration_time, 1e-6)
+        
+        return best_move or self.choose_move(board)
+    
     @abstractmethod
     def choose_move(self, board: Board) -> Tuple[str, Dict[str, Any]]:
         """
@@ -87,57 +619,44 @@ class Player(ABC):
 class RandomPlayer(Player):
     """Player that makes random moves."""
     
-    def __init__(self, color: PieceColor, name: str = None):
-        """Initialize random player."""
+    def __init__(self, color: PieceColor, name: str = None, seed: Optional[int] = None):
+        """
+        Initialize random player.
+        
+        Args:
+            color: The color of pieces this player controls
+            name: Optional name for the player
+            seed: Seed for a generator of the player's own; by default moves
+                come from the shared random module, so random.seed() applies
+        """
         if name is None:
             name = f"Random {color.value.capitalize()}"
         super().__init__(color, name)
         self.strategy_name = "random"
+        self._rng = random if seed is None else random.Random(seed)
     
     def choose_move(self, board: Board) -> Tuple[str, Dict[str, Any]]:
         """Choose a random valid move."""
-        available_pieces = self.get_available_pieces()
-        pieces_on_board = self.get_pieces_on_board(board)
-        
-        possible_moves = []
-        
-        # Add place moves for available pieces (using new Gobblet rules)
-        if available_pieces:
-            for piece in available_pieces:
-                valid_positions = board.get_valid_moves_for_new_piece(self.color, piece.size)
-                for pos in valid_positions:
-                    possible_moves.append(("place", {
-                        "piece": piece,
-                        "position": pos
-                    }))
-        
-        # Add move moves for pieces on board (existing pieces have more flexibility)
-        for piece, current_pos in pieces_on_board:
-            valid_positions = board.get_valid_moves_for_existing_piece(self.color, piece.size)
-            for new_pos in valid_positions:
-                if new_pos != current_pos:
-                    possible_moves.append(("move", {
-                        "piece": piece,
-                        "from_position": current_pos,
-                        "to_position": new_pos
-                    }))
-        
-        if not possible_moves:
-            # No valid moves available
-            return ("place", {"piece": None, "position": None})
-        
-        return random.choice(possible_moves)
-
+        return _random_move(self, board, self._rng)
 
 class GreedyPlayer(Player):
     """Player that prioritizes winning moves and blocking opponent wins."""
     
-    def __init__(self, color: PieceColor, name: str = None):
-        """Initialize greedy player."""
+    def __init__(self, color: PieceColor, name: str = None, search_depth: int = 0):
+        """
+        Initialize greedy player.
+        
+        Args:
+            color: The color of pieces this player controls
+            name: Optional name for the player
+            search_depth: Plies of lookahead used to check heuristic moves
+                (default 0, none); 2 catches moves that hand the opponent a win
+        """
         if name is None:
             name = f"Greedy {color.value.capitalize()}"
         super().__init__(color, name)
         self.strategy_name = "greedy"
+        self.search_depth = search_depth
     
     def choose_move(self, board: Board) -> Tuple[str, Dict[str, Any]]:
         """Choose a move that prioritizes winning or blocking."""
@@ -149,104 +668,55 @@ class GreedyPlayer(Player):
         # Then, check for blocking opponent's winning moves
         blocking_move = self._find_blocking_move(board)
         if blocking_move:
-            return blocking_move
+            return self._checked_by_search(board, blocking_move)
         
         # Otherwise, make a strategic move
-        return self._make_strategic_move(board)
-    
-    def _find_winning_move(self, board: Board) -> Optional[Tuple[str, Dict[str, Any]]]:
-        """Find a move that wins the game immediately."""
-        return self._find_move_for_color(board, self.color)
+        return self._checked_by_search(board, self._make_strategic_move(board))
     
     def _find_blocking_move(self, board: Board) -> Optional[Tuple[str, Dict[str, Any]]]:
         """Find a move that blocks the opponent from winning."""
-        opponent_color = PieceColor.DARK if self.color == PieceColor.LIGHT else PieceColor.LIGHT
-        blocking_moves = []
+        opponent_color = _OPPONENT_COLOR[self.color]
+        available_pieces = self._first_of_each_size(self.get_available_pieces())
+        pieces_on_board = self.get_pieces_on_board(board)
+        
+        # Cover the cells that complete an opponent line first, smallest piece first
+        for row, col, min_size in board.candidate_wincells(opponent_color):
+            for piece in available_pieces:
+                if piece.size.value >= min_size and self._would_block_win(board, piece, (row, col), opponent_color):
+                    return ("place", {"piece": piece, "position": (row, col)})
+            
+            for piece, current_pos in pieces_on_board:
+                if piece.size.value >= min_size and self._would_block_win(board, piece, (row, col), opponent_color):
+                    return ("move", {
+                        "piece": piece,
+                        "from_position": current_pos,
+                        "to_position": (row, col)
+                    })
         
         # Find where opponent could win
-        for row in range(board.size):
-            for col in range(board.size):
-                # Try placing our pieces to block
-                available_pieces = self.get_available_pieces()
-                for piece in available_pieces:
-                    if self._would_block_win(board, piece, (row, col), opponent_color):
-                        blocking_moves.append(("place", {"piece": piece, "position": (row, col)}))
-                
-                # Try moving our pieces to block
-                pieces_on_board = self.get_pieces_on_board(board)
-                for piece, current_pos in pieces_on_board:
-                    if self._would_block_win(board, piece, (row, col), opponent_color):
-                        blocking_moves.append(("move", {
-                            "piece": piece,
-                            "from_position": current_pos,
-                            "to_position": (row, col)
-                        }))
+        blocking_moves = [candidate for candidate in self._legal_candidates(board, available_pieces, pieces_on_board)
+                          if self._would_block_win(board, candidate[0], candidate[2], opponent_color)]
         
         # Return random blocking move if multiple exist
-        return random.choice(blocking_moves) if blocking_moves else None
-    
-    def _find_move_for_color(self, board: Board, color: PieceColor) -> Optional[Tuple[str, Dict[str, Any]]]:
-        """Find a winning move for the specified color."""
-        winning_moves = []
-        
-        # Check all possible positions
-        for row in range(board.size):
-            for col in range(board.size):
-                # Try placing available pieces
-                if color == self.color:
-                    available_pieces = self.get_available_pieces()
-                    for piece in available_pieces:
-                        if self._would_win(board, piece, (row, col)):
-                            winning_moves.append(("place", {"piece": piece, "position": (row, col)}))
-                    
-                    # Try moving pieces on board
-                    pieces_on_board = self.get_pieces_on_board(board)
-                    for piece, current_pos in pieces_on_board:
-                        if self._would_win(board, piece, (row, col)):
-                            winning_moves.append(("move", {
-                                "piece": piece,
-                                "from_position": current_pos,
-                                "to_position": (row, col)
-                            }))
-        
-        # Return random winning move if multiple exist
-        return random.choice(winning_moves) if winning_moves else None
-    
-    def _would_win(self, board: Board, piece: Piece, position: Tuple[int, int]) -> bool:
-        """Check if placing/moving a piece would result in a win."""
-        row, col = position
-        
-        # Create a copy of the board to test the move
-        test_board = board.copy()
-        
-        # If piece is on board, remove it first
-        if piece.position:
-            test_board.remove_piece(piece.position[0], piece.position[1])
-        
-        # Try placing the piece
-        if test_board.place_piece(piece, row, col):
-            return test_board.check_winner() == self.color
-        
-        return False
+        return _candidate_move(*random.choice(blocking_moves)) if blocking_moves else None
     
     def _would_block_win(self, board: Board, piece: Piece, position: Tuple[int, int], opponent_color: PieceColor) -> bool:
         """Check if placing a piece would block opponent's win."""
         row, col = position
         
-        # First check if opponent could win at this position
-        test_board = board.copy()
-        
         # Simulate opponent placing a piece here
         # We'll check if any opponent piece placement here would win
-        existing_piece = test_board.get_top_piece(row, col)
+        existing_piece = board.get_top_piece(row, col)
         if existing_piece and existing_piece.color != opponent_color:
             return False  # Can't place opponent piece here
         
         # Check if our piece placement would prevent opponent win
-        if piece.position:
-            test_board.remove_piece(piece.position[0], piece.position[1])
+        token = board.make_move(piece, row, col)
+        if token is None:
+            return False
         
-        return test_board.place_piece(piece, row, col)
+        board.undo_move(token)
+        return True
     
     def _make_strategic_move(self, board: Board) -> Tuple[str, Dict[str, Any]]:
         """Make a strategic move when no immediate win/block is needed."""
@@ -257,15 +727,16 @@ class GreedyPlayer(Player):
         if available_pieces:
             # Randomize piece order but still prefer larger pieces (70% of the time)
             if random.random() < 0.7:
-                available_pieces.sort(key=lambda p: p.size.value, reverse=True)
+                available_pieces.sort(key=lambda p: _SIZE_ORDER[p.size], reverse=True)
             else:
                 random.shuffle(available_pieces)
             
             strategic_moves = []
+            new_moves_by_size, _ = board.get_valid_targets(self.color)
             
             for piece in available_pieces:
                 # Try center positions first (using new piece rules)
-                valid_positions = board.get_valid_moves_for_new_piece(self.color, piece.size)
+                valid_positions = new_moves_by_size[piece.size]
                 center_valid = [pos for pos in center_positions if pos in valid_positions]
                 
                 # Add center moves to strategic options
@@ -284,33 +755,31 @@ class GreedyPlayer(Player):
                 return random.choice(best_moves)
         
         # Fall back to random move
-        random_player = RandomPlayer(self.color)
-        return random_player.choose_move(board)
+        return _random_move(self, board)
     
-    def _get_center_positions(self, board: Board) -> List[Tuple[int, int]]:
+    def _get_center_positions(self, board: Board) -> Tuple[Tuple[int, int], ...]:
         """Get positions closer to the center of the board."""
-        center = board.size // 2
-        positions = []
-        
-        # Add positions in order of distance from center
-        for distance in range(center + 1):
-            for row in range(board.size):
-                for col in range(board.size):
-                    if abs(row - center) + abs(col - center) == distance:
-                        positions.append((row, col))
-        
-        return positions
+        return _center_order(board.size)
 
 
 class DefensivePlayer(Player):
     """Player that focuses on defensive play and board control."""
     
-    def __init__(self, color: PieceColor, name: str = None):
-        """Initialize defensive player."""
+    def __init__(self, color: PieceColor, name: str = None, search_depth: int = 0):
+        """
+        Initialize defensive player.
+        
+        Args:
+            color: The color of pieces this player controls
+            name: Optional name for the player
+            search_depth: Plies of lookahead used to check heuristic moves
+                (default 0, none); searches cost far more per turn than the heuristics
+        """
         if name is None:
             name = f"Defensive {color.value.capitalize()}"
         super().__init__(color, name)
         self.strategy_name = "defensive"
+        self.search_depth = search_depth
     
     def choose_move(self, board: Board) -> Tuple[str, Dict[str, Any]]:
         """Choose a defensive move."""
@@ -322,56 +791,27 @@ class DefensivePlayer(Player):
         # Priority on blocking opponent
         blocking_move = self._find_blocking_move(board)
         if blocking_move:
-            return blocking_move
+            return self._checked_by_search(board, blocking_move)
         
         # Focus on controlling key positions
-        return self._make_defensive_move(board)
-    
-    def _find_winning_move(self, board: Board) -> Optional[Tuple[str, Dict[str, Any]]]:
-        """Find immediate winning move."""
-        winning_moves = []
-        
-        for row in range(board.size):
-            for col in range(board.size):
-                available_pieces = self.get_available_pieces()
-                for piece in available_pieces:
-                    test_board = board.copy()
-                    if test_board.place_piece(piece, row, col):
-                        if test_board.check_winner() == self.color:
-                            winning_moves.append(("place", {"piece": piece, "position": (row, col)}))
-                
-                pieces_on_board = self.get_pieces_on_board(board)
-                for piece, current_pos in pieces_on_board:
-                    test_board = board.copy()
-                    test_board.remove_piece(current_pos[0], current_pos[1])
-                    if test_board.place_piece(piece, row, col):
-                        if test_board.check_winner() == self.color:
-                            winning_moves.append(("move", {
-                                "piece": piece,
-                                "from_position": current_pos,
-                                "to_position": (row, col)
-                            }))
-        
-        # Return random winning move if multiple exist
-        return random.choice(winning_moves) if winning_moves else None
+        return self._checked_by_search(board, self._make_defensive_move(board))
     
     def _find_blocking_move(self, board: Board) -> Optional[Tuple[str, Dict[str, Any]]]:
         """Find move that blocks opponent."""
         # Similar to greedy player but more thorough
-        opponent_color = PieceColor.DARK if self.color == PieceColor.LIGHT else PieceColor.LIGHT
+        opponent_color = _OPPONENT_COLOR[self.color]
         blocking_moves = []
+        available_pieces = self._first_of_each_size(self.get_available_pieces())
         
-        # Check all positions for potential opponent wins
-        for row in range(board.size):
-            for col in range(board.size):
-                # Test if opponent could win by placing at this position
-                if self._opponent_could_win_here(board, (row, col), opponent_color):
-                    # Try to block with our pieces
-                    available_pieces = self.get_available_pieces()
-                    for piece in available_pieces:
-                        existing_piece = board.get_top_piece(row, col)
-                        if existing_piece is None or piece.can_cover(existing_piece):
-                            blocking_moves.append(("place", {"piece": piece, "position": (row, col)}))
+        # Opponent placements can only win on cells that complete one of their lines
+        for row, col, _ in board.candidate_wincells(opponent_color):
+            # Test if opponent could win by placing at this position
+            if self._opponent_could_win_here(board, (row, col), opponent_color):
+                # Try to block with our pieces
+                for piece in available_pieces:
+                    existing_piece = board.get_top_piece(row, col)
+                    if existing_piece is None or piece.can_cover(existing_piece):
+                        blocking_moves.append(("place", {"piece": piece, "position": (row, col)}))
         
         # Return random blocking move if multiple exist
         return random.choice(blocking_moves) if blocking_moves else None
@@ -379,15 +819,16 @@ class DefensivePlayer(Player):
     def _opponent_could_win_here(self, board: Board, position: Tuple[int, int], opponent_color: PieceColor) -> bool:
         """Check if opponent could win by playing at this position."""
         row, col = position
-        test_board = board.copy()
+        
+        # Any new opponent piece here wins if it completes a line through the cell
+        if not board.completes_line(opponent_color, row, col):
+            return False
         
         # Simulate opponent placing different sizes here
         for size in PieceSize:
-            test_piece = Piece(opponent_color, size, -1)  # Temporary piece
-            if test_board.place_piece(test_piece, row, col):
-                if test_board.check_winner() == opponent_color:
-                    return True
-                test_board.remove_piece(row, col)  # Remove test piece
+            test_piece = self._probe(opponent_color, size)  # Temporary piece
+            if board.can_place(test_piece, row, col):
+                return True
         
         return False
     
@@ -403,14 +844,15 @@ class DefensivePlayer(Player):
                 random.shuffle(available_pieces)
             else:
                 # Prefer medium to large pieces for defense
-                available_pieces.sort(key=lambda p: p.size.value, reverse=True)
+                available_pieces.sort(key=lambda p: _SIZE_ORDER[p.size], reverse=True)
             
             defensive_moves = []
+            new_moves_by_size, _ = board.get_valid_targets(self.color)
             
             # Collect all valid defensive moves
             for piece in available_pieces:
                 # Check new piece placement rules
-                valid_positions = board.get_valid_moves_for_new_piece(self.color, piece.size)
+                valid_positions = new_moves_by_size[piece.size]
                 
                 # Prioritize strategic positions that are also valid
                 strategic_valid = [pos for pos in strategic_positions if pos in valid_positions]
@@ -430,37 +872,10 @@ class DefensivePlayer(Player):
         # Fall back to any valid move
         return self._make_any_valid_move(board)
     
-    def _get_strategic_positions(self, board: Board) -> List[Tuple[int, int]]:
+    def _get_strategic_positions(self, board: Board) -> Tuple[Tuple[int, int], ...]:
         """Get positions in order of strategic importance."""
-        positions = []
-        
-        # Corners first
-        corners = [(0, 0), (0, board.size-1), (board.size-1, 0), (board.size-1, board.size-1)]
-        positions.extend(corners)
-        
-        # Center positions
-        center = board.size // 2
-        if board.size % 2 == 1:
-            positions.append((center, center))
-        else:
-            positions.extend([(center-1, center-1), (center-1, center), 
-                             (center, center-1), (center, center)])
-        
-        # Edges
-        for i in range(board.size):
-            positions.extend([(0, i), (board.size-1, i), (i, 0), (i, board.size-1)])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_positions = []
-        for pos in positions:
-            if pos not in seen:
-                seen.add(pos)
-                unique_positions.append(pos)
-        
-        return unique_positions
+        return _strategic_order(board.size)
     
     def _make_any_valid_move(self, board: Board) -> Tuple[str, Dict[str, Any]]:
         """Make any valid move as fallback."""
-        random_player = RandomPlayer(self.color)
-        return random_player.choose_move(board)
+        return _random_move(self, board)
@@ -2,38 +2,230 @@
 Game simulation engine for running multiple Gobblet games.
 """
 
+import io
+import os
 import random
-from typing import List, Dict, Any, Type, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import List, Dict, Any, Type, Optional, Iterator, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 import time
+import uuid
+from .board import Board
 from .game import GobbletGame
-from .player import Player, RandomPlayer, GreedyPlayer, DefensivePlayer, PieceColor
-from .moves import GameDataManager
-from .piece import PieceColor
+from .player import Player, RandomPlayer, GreedyPlayer, DefensivePlayer, PieceColor, _pick_candidate
+from .moves import GameDataManager, GameRecord, MoveTracker
+from .piece import Piece, PieceColor, PieceSize
+
+
+@dataclass
+class GameResult:
+    """Summary of one simulated game; the full game record is stored separately."""
+    __slots__ = ("game_id", "winner", "light_strategy", "dark_strategy",
+                 "turn_count", "move_count", "duration_seconds")
+    game_id: str
+    winner: Optional[PieceColor]  # None for a draw
+    light_strategy: str
+    dark_strategy: str
+    turn_count: int
+    move_count: int
+    duration_seconds: float
+
+
+def _matchup_label(light_strategy: str, dark_strategy: str) -> str:
+    """Render a (light, dark) matchup key for display."""
+    return f"{light_strategy}_vs_{dark_strategy}"
+
+
+def _warm_tables(board_size: int) -> None:
+    """Build the cached zobrist and line tables for a board size ahead of the first game."""
+    Board(board_size).get_valid_targets(PieceColor.LIGHT)
+
+
+def _init_worker(board_size: int = 4) -> None:
+    """
+    Prepare a worker process before it takes any games.
+    
+    Reseeds the random generator so forked workers don't replay the same
+    games, and warms the board tables, which spawned workers start without.
+    
+    Args:
+        board_size: Size of the boards the worker will play on
+    """
+    random.seed()
+    _warm_tables(board_size)
+
+
+def _new_player(player_class: Type[Player], color: PieceColor,
+                search_depth: int = 0) -> Player:
+    """Create a player that looks search_depth plies ahead (random players never search)."""
+    player = player_class(color)
+    player.search_depth = search_depth
+    return player
+
+
+def _run_one(light_class: Type[Player], dark_class: Type[Player],
+             light_strategy: str, dark_strategy: str,
+             board_size: int, search_depth: int = 0) -> Tuple[GameResult, GameRecord]:
+    """
+    Play one game and return its summary and game record separately.
+    
+    Module-level so it can run in a worker process; the caller hands the
+    record to its data manager and keeps only the small summary.
+    
+    Args:
+        light_class: Player class for the light player
+        dark_class: Player class for the dark player
+        light_strategy: Strategy name for the light player
+        dark_strategy: Strategy name for the dark player
+        board_size: Size of the game board
+        search_depth: Lookahead plies for strategy players (0 = no search)
+        
+    Returns:
+        Tuple of (result summary, game record)
+    """
+    if light_class is RandomPlayer and dark_class is RandomPlayer:
+        return _play_random_random(board_size)
+    
+    game = GobbletGame(_new_player(light_class, PieceColor.LIGHT, search_depth),
+                       _new_player(dark_class, PieceColor.DARK, search_depth),
+                       board_size)
+    
+    start_time = time.perf_counter()
+    winner = game.play_game()
+    end_time = time.perf_counter()
+    
+    return GameResult(
+        game_id=game.game_id,
+        winner=winner,
+        light_strategy=light_strategy,
+        dark_strategy=dark_strategy,
+        turn_count=game.turn_count,
+        move_count=len(game.move_tracker.moves),
+        duration_seconds=end_time - start_time
+    ), game.get_game_record()
+
+
+def _play_random_random(board_size: int) -> Tuple[GameResult, GameRecord]:
+    """
+    Play one random vs random game without players or GobbletGame dispatch.
+    
+    Follows the same rules as GobbletGame.play_turn and draws moves exactly
+    as RandomPlayer does, so a seeded game plays out identically, but it
+    picks an index into the legal moves instead of building them all.
+    
+    Args:
+        board_size: Size of the game board
+        
+    Returns:
+        Tuple of (result summary, game record), as returned by _run_one
+    """
+    game_id = str(uuid.uuid4())
+    board = Board(board_size)
+    move_tracker = MoveTracker(game_id)
+    move_tracker.set_player_strategy(PieceColor.LIGHT, "random")
+    move_tracker.set_player_strategy(PieceColor.DARK, "random")
+    
+    # Same pieces and ids as Player._init_pieces
+    pieces = {
+        color: [Piece(color, size, first_id + i)
+                for i, size in enumerate(size for size in PieceSize
+                                         for _ in range(Player.PIECES_PER_SIZE))]
+        for color, first_id in ((PieceColor.LIGHT, 0), (PieceColor.DARK, 12))
+    }
+    
+    color, opponent = PieceColor.LIGHT, PieceColor.DARK  # Light always goes first
+    max_turns = 200
+    turn_count = 0
+    winner = None
+    start_time = time.perf_counter()
+    
+    while True:
+        turn_count += 1
+        if turn_count > max_turns:
+            break
+        
+        # Candidates in the same order as Player._legal_candidates
+        available_pieces = [piece for piece in pieces[color] if piece.position is None]
+        pieces_on_board = [(position.pieces[-1], (row, col))
+                           for row, board_row in enumerate(board.positions)
+                           for col, position in enumerate(board_row)
+                           if position.pieces and position.pieces[-1].color == color]
+        new_targets, existing_targets = board.get_valid_targets(color)
+        options = ([(piece, None, new_targets[piece.size]) for piece in available_pieces]
+                   + [(piece, origin, existing_targets[piece.size]) for piece, origin in pieces_on_board])
+        
+        candidate = _pick_candidate(options)
+        if candidate is None:
+            # No valid move, the current player loses
+            winner = opponent
+            break
+        piece, from_position, to_position = candidate
+        
+        captured_piece = board.get_top_piece(*to_position)
+        board.make_move(piece, *to_position)
+        move_tracker.record_move(
+            player_color=color,
+            move_type="place" if from_position is None else "move",
+            piece=piece,
+            from_position=from_position,
+            to_position=to_position,
+            captured_piece=captured_piece
+        )
+        
+        winner = board.check_winner()
+        if winner or board.is_board_full():
+            break
+        
+        color, opponent = opponent, color
+    
+    end_time = time.perf_counter()
+    move_tracker.end_game(winner)
+    
+    return GameResult(
+        game_id=game_id,
+        winner=winner,
+        light_strategy="random",
+        dark_strategy="random",
+        turn_count=turn_count,
+        move_count=len(move_tracker.moves),
+        duration_seconds=end_time - start_time
+    ), move_tracker.get_game_record()
 
 
 class GameSimulator:
     """Runs simulations of Gobblet games."""
     
-    def __init__(self, data_manager: Optional[GameDataManager] = None):
+    # Smaller batches run sequentially; worker dispatch would cost more than it saves
+    PARALLEL_THRESHOLD = 8
+    
+    def __init__(self, data_manager: Optional[GameDataManager] = None,
+                 search_depth: int = 0):
         """
         Initialize the simulator.
         
         Args:
             data_manager: Optional data manager for storing results
+            search_depth: Plies greedy and defensive players look ahead
+                before committing to a move (0 = no search)
         """
         self.data_manager = data_manager or GameDataManager()
+        self.search_depth = search_depth
         self.player_types = {
             "random": RandomPlayer,
             "greedy": GreedyPlayer,
             "defensive": DefensivePlayer
         }
+        self._executor: Optional[Executor] = None  # Shared worker pool while inside _pooled()
     
     def run_single_simulation(self, 
                             light_strategy: str = "random",
                             dark_strategy: str = "random",
                             board_size: int = 4,
-                            verbose: bool = False) -> Dict[str, Any]:
+                            verbose: bool = False) -> GameResult:
         """
         Run a single game simulation.
         
@@ -44,37 +236,21 @@ class GameSimulator:
             verbose: Whether to print game progress
             
         Returns:
-            Dictionary containing game results
+            GameResult summarizing the game; the full game record is saved
+            to the data manager rather than returned
         """
-        # Create players
-        light_player = self._create_player(light_strategy, PieceColor.LIGHT)
-        dark_player = self._create_player(dark_strategy, PieceColor.DARK)
-        
-        # Create and play game
-        game = GobbletGame(light_player, dark_player, board_size)
+        light_class = self._player_class(light_strategy)
+        dark_class = self._player_class(dark_strategy)
         
         if verbose:
-            print(f"Starting game: {light_player} vs {dark_player}")
-        
-        start_time = time.time()
-        winner = game.play_game()
-        end_time = time.time()
+            print(f"Starting game: {light_strategy} ({PieceColor.LIGHT.value}) vs "
+                  f"{dark_strategy} ({PieceColor.DARK.value})")
         
-        # Get game record and save it
-        game_record = game.get_game_record()
+        # Play the game and save its record
+        result, game_record = _run_one(light_class, dark_class, light_strategy, dark_strategy,
+                                       board_size, self.search_depth)
         self.data_manager.save_game(game_record)
         
-        result = {
-            "game_id": game.game_id,
-            "winner": winner.value if winner else "draw",
-            "light_strategy": light_strategy,
-            "dark_strategy": dark_strategy,
-            "turn_count": game.turn_count,
-            "duration_seconds": end_time - start_time,
-            "move_count": len(game.move_tracker.moves),
-            "game_record": game_record
-        }
-        
         if verbose:
             self._print_game_result(result)
         
@@ -86,7 +262,8 @@ class GameSimulator:
                            dark_strategy: str = "random",
                            board_size: int = 4,
                            verbose: bool = True,
-                           parallel: bool = True) -> Dict[str, Any]:
+                           parallel: bool = True,
+                           parallel_threshold: Optional[int] = None) -> Dict[str, Any]:
         """
         Run multiple game simulations.
         
@@ -97,17 +274,24 @@ class GameSimulator:
             board_size: Size of the game board
             verbose: Whether to print progress
             parallel: Whether to run games in parallel
+            parallel_threshold: Minimum batch size to run in parallel
+                (default: PARALLEL_THRESHOLD)
             
         Returns:
             Dictionary containing batch simulation results
         """
+        self._validate_strategies(light_strategy, dark_strategy)
+        
         if verbose:
             print(f"Running {num_games} games: {light_strategy} vs {dark_strategy}")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = []
         
-        if parallel and num_games > 1:
+        if parallel_threshold is None:
+            parallel_threshold = self.PARALLEL_THRESHOLD
+        
+        if parallel and num_games >= max(2, parallel_threshold):
             results = self._run_parallel_games(
                 num_games, light_strategy, dark_strategy, board_size, verbose
             )
@@ -116,17 +300,11 @@ class GameSimulator:
                 num_games, light_strategy, dark_strategy, board_size, verbose
             )
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Analyze results
-        analysis = self._analyze_batch_results(results)
-        analysis.update({
-            "total_simulation_time": end_time - start_time,
-            "games_per_second": num_games / (end_time - start_time),
-            "light_strategy": light_strategy,
-            "dark_strategy": dark_strategy,
-            "board_size": board_size
-        })
+        analysis = self._batch_analysis(results, end_time - start_time,
+                                        light_strategy, dark_strategy, board_size)
         
         if verbose:
             self._print_batch_analysis(analysis)
@@ -148,8 +326,14 @@ class GameSimulator:
             verbose: Whether to print progress
             
         Returns:
-            Dictionary containing tournament results
+            Dictionary containing tournament results; "matchups" is keyed by
+            (light_strategy, dark_strategy). When the matchups run in
+            parallel, a matchup's total_simulation_time is the summed time of
+            its games, since matchups overlap in the worker pool
         """
+        # Fail before any games are played rather than partway through
+        self._validate_strategies(*strategies)
+        
         if verbose:
             print(f"Running tournament with strategies: {strategies}")
             print(f"Games per matchup: {games_per_matchup}")
@@ -164,33 +348,48 @@ class GameSimulator:
         total_games = len(strategies) * len(strategies) * games_per_matchup
         games_completed = 0
         
-        start_time = time.time()
-        
-        # Run all matchups
-        for light_strategy in strategies:
-            for dark_strategy in strategies:
-                matchup_key = f"{light_strategy}_vs_{dark_strategy}"
-                
-                if verbose:
-                    print(f"Running matchup: {matchup_key}")
+        start_time = time.perf_counter()
+        
+        matchup_keys = [(light_strategy, dark_strategy)
+                        for light_strategy in strategies for dark_strategy in strategies]
+        parallel = total_games >= self.PARALLEL_THRESHOLD
+        
+        # Only a parallel tournament needs the worker pool
+        with self._pooled(board_size=board_size) if parallel else nullcontext() as executor:
+            # Queue every matchup's games up front, so the workers move straight
+            # on to the next matchup instead of idling while one finishes
+            pending = {}
+            if parallel:
+                max_workers = os.cpu_count() or 1
+                for matchup_key in matchup_keys:
+                    pending[matchup_key] = self._submit_games(executor, max_workers, games_per_matchup,
+                                                              *matchup_key, board_size)
+            
+            for matchup_key in matchup_keys:
+                if parallel:
+                    results = self._collect_games(pending.pop(matchup_key), games_per_matchup, verbose=False)
+                    # Matchups overlap in the pool, so wall time between them means
+                    # nothing; add up the time the workers spent on each game instead
+                    elapsed = sum(result.duration_seconds for result in results)
+                else:
+                    matchup_start = time.perf_counter()
+                    results = self._run_sequential_games(games_per_matchup, *matchup_key,
+                                                         board_size, verbose=False)
+                    elapsed = time.perf_counter() - matchup_start
                 
-                matchup_results = self.run_batch_simulation(
-                    num_games=games_per_matchup,
-                    light_strategy=light_strategy,
-                    dark_strategy=dark_strategy,
-                    board_size=board_size,
-                    verbose=False,
-                    parallel=True
+                tournament_results["matchups"][matchup_key] = self._batch_analysis(
+                    results, elapsed, *matchup_key, board_size
                 )
-                
-                tournament_results["matchups"][matchup_key] = matchup_results
                 games_completed += games_per_matchup
                 
+                # One line per finished matchup; the batches themselves run quietly
                 if verbose:
                     progress = (games_completed / total_games) * 100
-                    print(f"Tournament progress: {progress:.1f}% ({games_completed}/{total_games})")
+                    sys.stdout.write(f"Finished matchup: {_matchup_label(*matchup_key)} - "
+                                     f"tournament progress: {progress:.1f}% "
+                                     f"({games_completed}/{total_games})\n")
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Calculate overall statistics
         tournament_results["overall_stats"] = self._analyze_tournament_results(
@@ -204,68 +403,184 @@ class GameSimulator:
         
         return tournament_results
     
+    def _validate_strategies(self, *strategies: str) -> None:
+        """Raise ValueError for any strategy name without a player class."""
+        for strategy in strategies:
+            if strategy not in self.player_types:
+                raise ValueError(f"Unknown strategy: {strategy}. Available: {list(self.player_types.keys())}")
+    
+    def _player_class(self, strategy: str) -> Type[Player]:
+        """Get the player class for a strategy name."""
+        player_class = self.player_types.get(strategy)
+        if player_class is None:
+            self._validate_strategies(strategy)  # Raises with the list of known strategies
+        return player_class
+    
     def _create_player(self, strategy: str, color: PieceColor) -> Player:
         """Create a player with the specified strategy."""
-        if strategy not in self.player_types:
-            raise ValueError(f"Unknown strategy: {strategy}. Available: {list(self.player_types.keys())}")
+        return _new_player(self._player_class(strategy), color, self.search_depth)
+    
+    @contextmanager
+    def _pooled(self, max_workers: Optional[int] = None,
+                board_size: int = 4) -> Iterator[Executor]:
+        """
+        Share one worker pool between all parallel batches run inside the block.
+        
+        Nested uses reuse the outer pool; it is shut down when the outermost
+        block exits.
         
-        player_class = self.player_types[strategy]
-        return player_class(color)
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+            board_size: Board size whose tables the workers warm up front
+        """
+        if self._executor is not None:
+            yield self._executor
+            return
+        
+        # Warm the tables here too, so forked workers inherit them
+        _warm_tables(board_size)
+        
+        # Games are CPU-bound pure Python, so threads would just take turns on the GIL
+        self._executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                             initializer=_init_worker,
+                                             initargs=(board_size,))
+        try:
+            yield self._executor
+        finally:
+            self._executor.shutdown()
+            self._executor = None
     
     def _run_parallel_games(self, num_games: int, light_strategy: str, 
-                          dark_strategy: str, board_size: int, verbose: bool) -> List[Dict[str, Any]]:
-        """Run games in parallel using ThreadPoolExecutor."""
+                          dark_strategy: str, board_size: int, verbose: bool) -> List[GameResult]:
+        """Run games in parallel using ProcessPoolExecutor."""
+        # Use the shared pool if one is open, otherwise one just for this batch
+        max_workers = min(num_games, os.cpu_count() or 1)
+        with self._pooled(max_workers, board_size) as executor:
+            game_results = self._submit_games(executor, max_workers, num_games,
+                                              light_strategy, dark_strategy, board_size)
+            return self._collect_games(game_results, num_games, verbose)
+    
+    def _submit_games(self, executor: Executor, max_workers: int, num_games: int,
+                      light_strategy: str, dark_strategy: str,
+                      board_size: int) -> Iterator[Tuple[GameResult, GameRecord]]:
+        """
+        Queue a batch of games on a worker pool.
+        
+        Args:
+            executor: The worker pool
+            max_workers: Number of workers the games are spread over
+            num_games: Number of games to play
+            light_strategy: Strategy for light player
+            dark_strategy: Strategy for dark player
+            board_size: Size of the game board
+            
+        Returns:
+            Iterator over (result, game record) pairs in submission order
+        """
+        light_class = self._player_class(light_strategy)
+        dark_class = self._player_class(dark_strategy)
+        
+        # Hand games out in chunks (about four per worker) to amortize dispatch;
+        # map submits them all right away
+        args = (light_class, dark_class, light_strategy, dark_strategy, board_size,
+                self.search_depth)
+        chunksize = max(1, num_games // (max_workers * 4))
+        return executor.map(_run_one, *(repeat(arg, num_games) for arg in args),
+                            chunksize=chunksize)
+    
+    def _collect_games(self, game_results: Iterator[Tuple[GameResult, GameRecord]],
+                       num_games: int, verbose: bool) -> List[GameResult]:
+        """
+        Wait for a batch queued with _submit_games and save its game records.
+        
+        Args:
+            game_results: Iterator returned by _submit_games
+            num_games: Number of games in the batch
+            verbose: Whether to print progress
+            
+        Returns:
+            List of game results in submission order
+        """
         results = []
+        game_records = []
+        progress = io.StringIO()
         
-        with ThreadPoolExecutor(max_workers=min(num_games, 8)) as executor:
-            # Submit all games
-            futures = [
-                executor.submit(
-                    self.run_single_simulation,
-                    light_strategy, dark_strategy, board_size, False
-                )
-                for _ in range(num_games)
-            ]
+        # Collect results in submission order; workers can't share the data
+        # manager, so their records are gathered here and not kept in results
+        for i, (result, game_record) in enumerate(game_results):
+            game_records.append(game_record)
+            results.append(result)
             
-            # Collect results as they complete
-            for i, future in enumerate(as_completed(futures)):
-                result = future.result()
-                results.append(result)
-                
-                if verbose and (i + 1) % max(1, num_games // 10) == 0:
-                    print(f"Completed {i + 1}/{num_games} games")
+            if verbose and (i + 1) % max(1, num_games // 10) == 0:
+                progress.write(f"Completed {i + 1}/{num_games} games\n")
+        
+        # Progress goes out in one write rather than a print per checkpoint
+        if verbose:
+            sys.stdout.write(progress.getvalue())
         
+        # One write for the whole batch instead of rewriting the file per game
+        self.data_manager.save_games(game_records)
         return results
     
     def _run_sequential_games(self, num_games: int, light_strategy: str,
-                            dark_strategy: str, board_size: int, verbose: bool) -> List[Dict[str, Any]]:
+                            dark_strategy: str, board_size: int, verbose: bool) -> List[GameResult]:
         """Run games sequentially."""
+        # Resolve the player classes once rather than per game
+        light_class = self._player_class(light_strategy)
+        dark_class = self._player_class(dark_strategy)
         results = []
+        game_records = []
+        progress = io.StringIO()
         
         for i in range(num_games):
-            result = self.run_single_simulation(
-                light_strategy, dark_strategy, board_size, False
-            )
+            result, game_record = _run_one(light_class, dark_class, light_strategy, dark_strategy,
+                                           board_size, self.search_depth)
+            game_records.append(game_record)
             results.append(result)
             
             if verbose and (i + 1) % max(1, num_games // 10) == 0:
-                print(f"Completed {i + 1}/{num_games} games")
+                progress.write(f"Completed {i + 1}/{num_games} games\n")
+        
+        # Progress goes out in one write rather than a print per checkpoint
+        if verbose:
+            sys.stdout.write(progress.getvalue())
         
+        # One write for the whole batch instead of rewriting the file per game
+        self.data_manager.save_games(game_records)
         return results
     
-    def _analyze_batch_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _batch_analysis(self, results: List[GameResult], elapsed: float, light_strategy: str,
+                        dark_strategy: str, board_size: int) -> Dict[str, Any]:
+        """Analyze a batch and add its timing and settings, as returned by run_batch_simulation."""
+        analysis = self._analyze_batch_results(results)
+        analysis.update({
+            "total_simulation_time": elapsed,
+            "games_per_second": len(results) / elapsed if elapsed > 0 else 0.0,
+            "light_strategy": light_strategy,
+            "dark_strategy": dark_strategy,
+            "board_size": board_size
+        })
+        return analysis
+    
+    def _analyze_batch_results(self, results: List[GameResult]) -> Dict[str, Any]:
         """Analyze results from a batch of games."""
         if not results:
             return {"error": "No results to analyze"}
         
-        total_games = len(results)
-        light_wins = sum(1 for r in results if r["winner"] == "light")
-        dark_wins = sum(1 for r in results if r["winner"] == "dark")
-        draws = sum(1 for r in results if r["winner"] == "draw")
+        # Tally everything in one pass over the results
+        winners = Counter()
+        total_turns = total_moves = 0
+        total_duration = 0.0
+        for r in results:
+            winners[r.winner] += 1
+            total_turns += r.turn_count
+            total_moves += r.move_count
+            total_duration += r.duration_seconds
         
-        total_turns = sum(r["turn_count"] for r in results)
-        total_moves = sum(r["move_count"] for r in results)
-        total_duration = sum(r["duration_seconds"] for r in results)
+        total_games = len(results)
+        light_wins = winners[PieceColor.LIGHT]
+        dark_wins = winners[PieceColor.DARK]
+        draws = winners[None]
         
         return {
             "total_games": total_games,
@@ -281,7 +596,7 @@ class GameSimulator:
             "total_duration": total_duration
         }
     
-    def _analyze_tournament_results(self, matchups: Dict[str, Any], 
+    def _analyze_tournament_results(self, matchups: Dict[Tuple[str, str], Any], 
                                   strategies: List[str]) -> Dict[str, Any]:
         """Analyze tournament results across all matchups."""
         strategy_stats = {strategy: {
@@ -294,9 +609,7 @@ class GameSimulator:
         } for strategy in strategies}
         
         # Aggregate stats for each strategy
-        for matchup_key, matchup_data in matchups.items():
-            light_strategy, dark_strategy = matchup_key.split("_vs_")
-            
+        for (light_strategy, dark_strategy), matchup_data in matchups.items():
             # Update light player stats
             strategy_stats[light_strategy]["games_played"] += matchup_data["total_games"]
             strategy_stats[light_strategy]["wins_as_light"] += matchup_data["light_wins"]
@@ -326,12 +639,12 @@ class GameSimulator:
             "ranking": [strategy for strategy, _ in ranked_strategies]
         }
     
-    def _print_game_result(self, result: Dict[str, Any]) -> None:
+    def _print_game_result(self, result: GameResult) -> None:
         """Print the result of a single game."""
-        winner_str = result["winner"].capitalize() if result["winner"] != "draw" else "Draw"
-        print(f"Game {result['game_id'][:8]}: {winner_str} "
-              f"({result['turn_count']} turns, {result['move_count']} moves, "
-              f"{result['duration_seconds']:.2f}s)")
+        winner_str = result.winner.value.capitalize() if result.winner else "Draw"
+        print(f"Game {result.game_id[:8]}: {winner_str} "
+              f"({result.turn_count} turns, {result.move_count} moves, "
+              f"{result.duration_seconds:.2f}s)")
     
     def _print_batch_analysis(self, analysis: Dict[str, Any]) -> None:
         """Print analysis of batch simulation results."""
@@ -4,6 +4,7 @@ Tests for the Gobblet board functionality.
 
 import pytest
 from src.gobblet.board import Board, BoardPosition
+from src.gobblet.bitboard import line_occupied_masks, line_patterns
 from src.gobblet.piece import Piece, PieceColor, PieceSize
 
 
@@ -313,3 +314,216 @@ class TestBoard:
         board.remove_piece(0, 0)
         assert board.get_top_piece(0, 0) is None
         assert board_copy.get_top_piece(0, 0) is not None
+        assert board_copy.check_winner() is None
+        assert board_copy.zobrist != board.zobrist
+        
+        # The copy's own bookkeeping follows its moves
+        board_copy.remove_piece(0, 0)
+        assert board_copy == board
+        assert board_copy.zobrist == board.zobrist
+    
+    def test_make_and_undo_move(self):
+        """Test applying and reverting trial moves in place."""
+        board = Board(4)
+        
+        small_piece = Piece(PieceColor.DARK, PieceSize.SMALL, 1)
+        large_piece = Piece(PieceColor.LIGHT, PieceSize.LARGE, 2)
+        board.place_piece(small_piece, 0, 0)
+        board.place_piece(large_piece, 1, 1)
+        
+        # Move the large piece over the small one and revert it
+        token = board.make_move(large_piece, 0, 0)
+        assert token is not None
+        assert board.get_top_piece(0, 0) == large_piece
+        assert board.is_position_empty(1, 1)
+        assert large_piece.position == (0, 0)
+        
+        board.undo_move(token)
+        assert board.get_top_piece(0, 0) == small_piece
+        assert board.get_top_piece(1, 1) == large_piece
+        assert large_piece.position == (1, 1)
+        
+        # Placing a new piece and reverting leaves it off the board
+        new_piece = Piece(PieceColor.LIGHT, PieceSize.MEDIUM, 3)
+        token = board.make_move(new_piece, 2, 2)
+        assert board.get_top_piece(2, 2) == new_piece
+        board.undo_move(token)
+        assert board.is_position_empty(2, 2)
+        assert new_piece.position is None
+    
+    def test_make_move_illegal(self):
+        """Test that an illegal trial move leaves the board unchanged."""
+        board = Board(4)
+        
+        large_piece = Piece(PieceColor.DARK, PieceSize.LARGE, 1)
+        small_piece = Piece(PieceColor.LIGHT, PieceSize.SMALL, 2)
+        board.place_piece(large_piece, 0, 0)
+        board.place_piece(small_piece, 1, 1)
+        
+        assert board.make_move(small_piece, 0, 0) is None
+        assert board.get_top_piece(0, 0) == large_piece
+        assert board.get_top_piece(1, 1) == small_piece
+        assert small_piece.position == (1, 1)
+    
+    def test_zobrist_hash(self):
+        """Test that the incremental hash tracks board state."""
+        board = Board(4)
+        assert board.zobrist == 0
+        
+        piece1 = Piece(PieceColor.LIGHT, PieceSize.SMALL, 1)
+        piece2 = Piece(PieceColor.DARK, PieceSize.LARGE, 2)
+        board.place_piece(piece1, 0, 0)
+        board.place_piece(piece2, 2, 3)
+        
+        # Same state reached in a different order hashes the same
+        other = Board(4)
+        other.place_piece(Piece(PieceColor.DARK, PieceSize.LARGE, 5), 2, 3)
+        other.place_piece(Piece(PieceColor.LIGHT, PieceSize.SMALL, 6), 0, 0)
+        assert other.zobrist == board.zobrist
+        assert board.copy().zobrist == board.zobrist
+        
+        # Trial moves restore the hash when undone
+        before = board.zobrist
+        token = board.make_move(piece2, 0, 0)
+        assert board.zobrist != before
+        board.undo_move(token)
+        assert board.zobrist == before
+        
+        board.remove_piece(0, 0)
+        board.remove_piece(2, 3)
+        assert board.zobrist == 0
+    
+    def test_board_equality(self):
+        """Test packed top-grid tracking, equality and hashing."""
+        board = Board(4)
+        board.place_piece(Piece(PieceColor.LIGHT, PieceSize.SMALL, 1), 1, 2)
+        assert board._top_u64 == ((0 << 3) | (1 << 1) | 1) << ((1 * 4 + 2) * 4)
+        
+        other = Board(4)
+        assert board != other
+        other.place_piece(Piece(PieceColor.LIGHT, PieceSize.SMALL, 7), 1, 2)
+        assert board == other
+        assert hash(board) == hash(other)
+        assert len({board, other, board.copy()}) == 1
+        
+        # Same top pieces but different covered pieces are not equal
+        board.place_piece(Piece(PieceColor.DARK, PieceSize.LARGE, 2), 1, 2, is_new_piece=False)
+        other.remove_piece(1, 2)
+        other.place_piece(Piece(PieceColor.DARK, PieceSize.LARGE, 8), 1, 2)
+        assert board._top_u64 == other._top_u64
+        assert board != other
+        
+        board.remove_piece(1, 2)
+        board.remove_piece(1, 2)
+        assert board._top_u64 == 0
+        assert board._piece_bits == [0] * 6
+    
+    def test_win_masks(self):
+        """Test the winning-line bitmasks and the tie-break when both colors own a line."""
+        assert len(line_patterns(4)) == 10
+        
+        # Packed-state patterns: a line matches a color whatever the piece sizes
+        board = Board(4)
+        for col, size in enumerate([PieceSize.SMALL, PieceSize.LARGE, PieceSize.MEDIUM, PieceSize.SMALL]):
+            board.place_piece(Piece(PieceColor.DARK, size, 12 + col), 0, col)
+        mask, (light_pattern, dark_pattern) = line_patterns(4)[0]
+        assert board._top_u64 & mask == dark_pattern
+        assert board._top_u64 & mask != light_pattern
+        
+        # Line cell masks keep just the occupied bit of each cell
+        occupied_bits = line_occupied_masks(4)[0]
+        assert occupied_bits == 0x1111
+        assert board._top_u64 & occupied_bits == occupied_bits
+        
+        # When both colors own a line, the first line in row, column, diagonal order wins
+        for light_row, dark_row, winner in ((0, 3, PieceColor.LIGHT), (3, 0, PieceColor.DARK)):
+            board = Board(4)
+            for col in range(4):
+                board.place_piece(Piece(PieceColor.LIGHT, PieceSize.SMALL, col), light_row, col)
+                board.place_piece(Piece(PieceColor.DARK, PieceSize.SMALL, 12 + col), dark_row, col)
+            assert board.check_winner() == winner
+    
+    def test_wins_for(self):
+        """Test incremental win detection as pieces are covered and revealed."""
+        board = Board(4)
+        
+        for col in range(3):
+            board.place_piece(Piece(PieceColor.LIGHT, PieceSize.MEDIUM, col), 0, col)
+        assert not board.wins_for(PieceColor.LIGHT)
+        
+        last_piece = Piece(PieceColor.LIGHT, PieceSize.SMALL, 3)
+        board.place_piece(last_piece, 0, 3)
+        assert board.wins_for(PieceColor.LIGHT)
+        assert not board.wins_for(PieceColor.DARK)
+        
+        # Covering a piece in the line breaks the win, uncovering restores it
+        cover = Piece(PieceColor.DARK, PieceSize.LARGE, 12)
+        board.place_piece(cover, 0, 3, is_new_piece=False)
+        assert not board.wins_for(PieceColor.LIGHT)
+        assert board.check_winner() is None
+        
+        board.remove_piece(0, 3)
+        assert board.wins_for(PieceColor.LIGHT)
+        assert board.check_winner() == PieceColor.LIGHT
+    
+    def test_candidate_wincells(self):
+        """Test finding the cells that complete a line."""
+        board = Board(4)
+        assert board.candidate_wincells(PieceColor.DARK) == []
+        
+        for col in range(3):
+            board.place_piece(Piece(PieceColor.DARK, PieceSize.SMALL, col), 1, col)
+        assert board.candidate_wincells(PieceColor.DARK) == [(1, 3, PieceSize.SMALL.value)]
+        
+        # An opponent piece on the remaining cell raises the size needed to cover it
+        board.place_piece(Piece(PieceColor.LIGHT, PieceSize.MEDIUM, 5), 1, 3)
+        assert board.candidate_wincells(PieceColor.DARK) == [(1, 3, PieceSize.LARGE.value)]
+    
+    def test_completes_line(self):
+        """Test checking whether a cell would complete a line."""
+        board = Board(3)
+        board.place_piece(Piece(PieceColor.LIGHT, PieceSize.SMALL, 1), 0, 0)
+        board.place_piece(Piece(PieceColor.LIGHT, PieceSize.SMALL, 2), 1, 1)
+        
+        assert board.completes_line(PieceColor.LIGHT, 2, 2)
+        assert not board.completes_line(PieceColor.LIGHT, 2, 1)
+        assert not board.completes_line(PieceColor.DARK, 2, 2)
+        assert board.can_place(Piece(PieceColor.LIGHT, PieceSize.SMALL, 3), 2, 2)
+        assert not board.can_place(Piece(PieceColor.DARK, PieceSize.SMALL, 4), 1, 1)
+    
+    def test_valid_targets(self):
+        """Test that the one-pass valid targets match the per-size valid move lists."""
+        board = Board(4)
+        # Dark threatens the top row; light has a medium piece in the middle
+        for col in range(3):
+            board.place_piece(Piece(PieceColor.DARK, PieceSize.SMALL, 12 + col), 0, col)
+        board.place_piece(Piece(PieceColor.DARK, PieceSize.MEDIUM, 15), 2, 2)
+        board.place_piece(Piece(PieceColor.LIGHT, PieceSize.MEDIUM, 1), 1, 1)
+        
+        for color in PieceColor:
+            new_targets, existing_targets = board.get_valid_targets(color)
+            for size in PieceSize:
+                assert new_targets[size] == board.get_valid_moves_for_new_piece(color, size)
+                assert existing_targets[size] == board.get_valid_moves_for_existing_piece(color, size)
+                mask = board.valid_moves_mask(color, size)
+                assert bin(mask).count("1") == len(existing_targets[size])
+            assert board.get_valid_moves(color) == existing_targets[PieceSize.LARGE]
+        
+        # Only the threatening row may be covered by new light pieces
+        new_targets, existing_targets = board.get_valid_targets(PieceColor.LIGHT)
+        assert (0, 0) in new_targets[PieceSize.MEDIUM]
+        assert (2, 2) not in new_targets[PieceSize.LARGE]
+        assert (2, 2) in existing_targets[PieceSize.LARGE]
+        assert (2, 2) not in existing_targets[PieceSize.MEDIUM]
+    
+    def test_flat_cells(self):
+        """Test that the row views share the flat cell storage and pieces are counted under stacks."""
+        board = Board(4)
+        assert board.positions[2][3] is board._cells[2 * 4 + 3]
+        
+        board.place_piece(Piece(PieceColor.DARK, PieceSize.SMALL, 12), 2, 3)
+        board.place_piece(Piece(PieceColor.LIGHT, PieceSize.MEDIUM, 3), 2, 3, is_new_piece=False)
+        assert board.positions[2][3].piece_count() == 2
+        assert board.count_pieces(PieceColor.DARK) == {PieceSize.SMALL: 1, PieceSize.MEDIUM: 0, PieceSize.LARGE: 0}
+        assert board.count_pieces(PieceColor.LIGHT)[PieceSize.MEDIUM] == 1
+        assert board.copy() == board
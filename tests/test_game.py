@@ -2,9 +2,14 @@
 Tests for the Gobblet game core functionality.
 """
 
+import json
+import pickle
+import random
 import pytest
+from src.gobblet.board import Board
 from src.gobblet.game import GobbletGame
-from src.gobblet.player import RandomPlayer, GreedyPlayer, PieceColor
+from src.gobblet.moves import GameDataManager, GameRecord, LazyMoves
+from src.gobblet.player import RandomPlayer, GreedyPlayer, DefensivePlayer, PieceColor, WIN_SCORE
 from src.gobblet.piece import Piece, PieceSize
 
 
@@ -23,6 +28,15 @@ class TestGobbletGame:
         assert not game.game_over
         assert game.winner is None
         assert game.turn_count == 0
+        assert len(game.game_id) == 36  # Generated UUID
+    
+    def test_given_game_id(self):
+        """Test that a caller-supplied game id is used for the game record."""
+        game = GobbletGame(RandomPlayer(PieceColor.LIGHT), RandomPlayer(PieceColor.DARK), game_id="game-1")
+        game.play_game()
+        
+        assert game.game_id == "game-1"
+        assert game.get_game_record().game_id == "game-1"
     
     def test_player_turn_switching(self):
         """Test that players switch turns correctly."""
@@ -155,6 +169,56 @@ class TestGobbletGame:
         assert move.to_position == (2, 2)
         assert move.from_position is None
     
+    def test_game_record_pickling(self):
+        """Test that game records survive a pickle round trip (used by worker processes)."""
+        light_player = RandomPlayer(PieceColor.LIGHT)
+        dark_player = RandomPlayer(PieceColor.DARK)
+        game = GobbletGame(light_player, dark_player)
+        game.play_game()
+        
+        record = game.get_game_record()
+        record.moves[0].to_dict()  # Populate the serialized cache
+        restored = pickle.loads(pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+        
+        assert restored.moves == record.moves
+        assert restored.to_dict() == record.to_dict()
+    
+    def test_lazy_loaded_moves(self, tmp_path):
+        """Test that loaded games defer move parsing and parse to the same moves as an eager load."""
+        data_manager = GameDataManager(str(tmp_path / "games.json"))
+        game = GobbletGame(RandomPlayer(PieceColor.LIGHT), RandomPlayer(PieceColor.DARK))
+        game.play_game()
+        data_manager.save_game(game.get_game_record())
+        
+        with open(data_manager.data_file) as f:
+            eager = GameRecord.from_dict(json.load(f)[0])
+        
+        loaded = GameDataManager(data_manager.data_file).load_games()[0]
+        assert isinstance(loaded.moves, LazyMoves)
+        assert not loaded.moves.is_materialized
+        assert len(loaded.moves) == eager.total_moves
+        assert loaded.to_dict() == eager.to_dict()
+        assert not loaded.moves.is_materialized
+        
+        moves = loaded.materialize_moves()
+        assert moves == eager.moves
+        assert loaded.moves is moves
+    
+    def test_packed_moves(self):
+        """Test that recorded moves serialize the same packed or built as Move objects."""
+        light_player = RandomPlayer(PieceColor.LIGHT)
+        dark_player = RandomPlayer(PieceColor.DARK)
+        game = GobbletGame(light_player, dark_player)
+        game.play_game()
+        
+        record = game.get_game_record()
+        packed_dicts = record.to_dict()["moves"]
+        
+        assert len(packed_dicts) == record.total_moves == len(game.move_tracker.moves)
+        assert packed_dicts == [move.to_dict() for move in record.moves]
+        assert GameRecord.from_dict(record.to_dict()).moves == record.moves
+        assert [move.move_number for move in record.moves] == list(range(1, record.total_moves + 1))
+    
     def test_full_game_simulation(self):
         """Test that a full game can be played to completion."""
         light_player = RandomPlayer(PieceColor.LIGHT)
@@ -199,3 +263,116 @@ class TestGobbletGame:
         updated_state = game.get_game_state()
         assert updated_state["turn_count"] == 1
         assert updated_state["move_count"] >= 1
+    
+    def test_search_finds_win(self):
+        """Test that the negamax search finds a winning move and restores the board."""
+        light_player = GreedyPlayer(PieceColor.LIGHT)
+        dark_player = GreedyPlayer(PieceColor.DARK)
+        game = GobbletGame(light_player, dark_player)
+        
+        # Light owns three cells of the top row
+        light_pieces = light_player.get_available_pieces()
+        for col in range(3):
+            game.board.place_piece(light_pieces[col], 0, col)
+        zobrist = game.board.zobrist
+        
+        score, move = light_player._search_move(game.board, 2)
+        assert score >= WIN_SCORE
+        assert move[0] == "place"
+        assert move[1]["position"] == (0, 3)
+        assert game.board.zobrist == zobrist
+        assert game.board.check_winner() is None
+    
+    def test_search_scores_no_move_as_loss(self, monkeypatch):
+        """Test that the search scores a position without legal moves as lost for the side to move."""
+        light_player = GreedyPlayer(PieceColor.LIGHT)
+        game = GobbletGame(light_player, GreedyPlayer(PieceColor.DARK))
+        monkeypatch.setattr(light_player, "_ordered_moves", lambda *args: [])
+        
+        score, move = light_player._negamax(game.board, 2, -WIN_SCORE * 10, WIN_SCORE * 10, PieceColor.LIGHT)
+        assert score == -WIN_SCORE - 2
+        assert move is None
+    
+    def test_time_limited_move(self):
+        """Test that iterative deepening returns a legal move within a short budget."""
+        light_player = GreedyPlayer(PieceColor.LIGHT)
+        dark_player = GreedyPlayer(PieceColor.DARK)
+        game = GobbletGame(light_player, dark_player)
+        
+        move_type, move_data = light_player.choose_move_time_limited(game.board, 50)
+        assert game._execute_move(move_type, move_data)
+        assert game.board.check_winner() is None
+    
+    def test_strategy_players_skip_search_by_default(self, monkeypatch):
+        """Test that strategy players only pay for the lookahead search when asked to."""
+        from src.gobblet.player import Player
+        
+        searches = []
+        negamax = Player._negamax
+        
+        def counting_negamax(player, *args):
+            searches.append(player)
+            return negamax(player, *args)
+        
+        monkeypatch.setattr(Player, "_negamax", counting_negamax)
+        
+        for seed in range(5):
+            random.seed(seed)
+            game = GobbletGame(GreedyPlayer(PieceColor.LIGHT), DefensivePlayer(PieceColor.DARK))
+            game.play_game()
+        
+        assert searches == []
+        
+        assert GreedyPlayer(PieceColor.LIGHT, search_depth=2).search_depth == 2
+    
+    def test_probe_pieces(self):
+        """Test that probe pieces belong to one player, are reused per key and leave the board clean."""
+        player = GreedyPlayer(PieceColor.LIGHT)
+        probe = player._probe(PieceColor.DARK, PieceSize.MEDIUM)
+        assert probe is player._probe(PieceColor.DARK, PieceSize.MEDIUM)
+        assert probe is not player._probe(PieceColor.DARK, PieceSize.MEDIUM, 1)
+        assert probe is not GreedyPlayer(PieceColor.LIGHT)._probe(PieceColor.DARK, PieceSize.MEDIUM)
+        assert probe.piece_id == -1
+        
+        board = Board(4)
+        token = board.make_move(probe, 1, 1)
+        assert board.get_top_piece(1, 1) is probe
+        board.undo_move(token)
+        assert probe.position is None
+        assert board == Board(4)
+    
+    def test_legal_candidates(self):
+        """Test that the shared move generator yields only executable moves."""
+        light_player = RandomPlayer(PieceColor.LIGHT)
+        dark_player = RandomPlayer(PieceColor.DARK)
+        game = GobbletGame(light_player, dark_player)
+        
+        # Every available piece can go on every empty cell
+        candidates = list(light_player._legal_candidates(game.board))
+        assert len(candidates) == 9 * 16
+        assert all(from_position is None for _, from_position, _ in candidates)
+        
+        game.play_turn()
+        game.play_turn()
+        for piece, from_position, to_position in light_player._legal_candidates(game.board):
+            board_zobrist = game.board.zobrist
+            assert piece.position == from_position
+            if from_position is None:
+                assert game.board.can_place(piece, *to_position)
+            else:
+                token = game.board.make_move(piece, *to_position)
+                assert token is not None
+                game.board.undo_move(token)
+            assert game.board.zobrist == board_zobrist
+    
+    def test_seeded_random_player(self):
+        """Test that seeded random players replay the same game."""
+        def play(seed):
+            game = GobbletGame(RandomPlayer(PieceColor.LIGHT, seed=seed),
+                               RandomPlayer(PieceColor.DARK, seed=seed + 1))
+            game.play_game()
+            return [(move.piece_id, move.from_position, move.to_position)
+                    for move in game.move_tracker.moves]
+        
+        assert play(7) == play(7)
+        assert play(7) != play(8)
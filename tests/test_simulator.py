@@ -2,8 +2,12 @@
 Tests for the game simulator.
 """
 
+import json
+import random
 import pytest
-from src.gobblet.simulator import GameSimulator
+from src.gobblet.simulator import GameSimulator, GameResult, _play_random_random
+from src.gobblet.game import GobbletGame
+from src.gobblet.player import RandomPlayer
 from src.gobblet.moves import GameDataManager
 from src.gobblet.piece import PieceColor
 
@@ -30,18 +34,18 @@ class TestGameSimulator:
             verbose=False
         )
         
-        assert "game_id" in result
-        assert "winner" in result
-        assert result["winner"] in ["light", "dark", "draw"]
-        assert "light_strategy" in result
-        assert "dark_strategy" in result
-        assert "turn_count" in result
-        assert "duration_seconds" in result
-        assert "move_count" in result
-        assert "game_record" in result
+        assert isinstance(result, GameResult)
+        assert result.winner in [PieceColor.LIGHT, PieceColor.DARK, None]
+        assert result.light_strategy == "random"
+        assert result.dark_strategy == "random"
+        assert result.turn_count > 0
+        assert result.move_count > 0
+        assert result.duration_seconds >= 0
+        assert not hasattr(result, "game_record")
         
         # Verify the game was saved
         assert len(data_manager.games) == 1
+        assert data_manager.games[0].game_id == result.game_id
     
     def test_batch_simulation(self):
         """Test running multiple game simulations."""
@@ -101,6 +105,7 @@ class TestGameSimulator:
         
         # Check that each matchup has the expected number of games
         for matchup_key, matchup_data in tournament_results["matchups"].items():
+            assert matchup_key in [(light, dark) for light in strategies for dark in strategies]
             assert matchup_data["total_games"] == games_per_matchup
         
         # Check overall stats
@@ -120,12 +125,35 @@ class TestGameSimulator:
         total_expected_games = len(strategies) * len(strategies) * games_per_matchup
         assert tournament_results["total_games"] == total_expected_games
     
+    def test_tournament_timing(self, monkeypatch):
+        """Test that tournaments report per-matchup time and only start a pool when parallel."""
+        simulator = GameSimulator(GameDataManager("test_tournament_data.json"))
+        
+        # Eight games reach PARALLEL_THRESHOLD, so matchups overlap in the pool
+        tournament_results = simulator.run_tournament(["random", "greedy"], games_per_matchup=2,
+                                                      verbose=False)
+        for matchup_data in tournament_results["matchups"].values():
+            assert matchup_data["total_simulation_time"] == pytest.approx(matchup_data["total_duration"])
+        
+        def no_pool(*args, **kwargs):
+            raise AssertionError("a sequential tournament started a worker pool")
+        
+        monkeypatch.setattr("src.gobblet.simulator.ProcessPoolExecutor", no_pool)
+        tournament_results = simulator.run_tournament(["random", "greedy"], games_per_matchup=1,
+                                                      verbose=False)
+        assert tournament_results["total_games"] == 4
+    
     def test_invalid_strategy(self):
         """Test that invalid strategies raise an error."""
         simulator = GameSimulator()
         
         with pytest.raises(ValueError):
             simulator._create_player("invalid_strategy", PieceColor.LIGHT)
+        
+        # Tournaments reject unknown strategies before playing any games
+        with pytest.raises(ValueError):
+            simulator.run_tournament(["random", "invalid_strategy"], games_per_matchup=1, verbose=False)
+        assert len(simulator.data_manager.games) == 0
     
     def test_parallel_vs_sequential(self):
         """Test that parallel and sequential execution produce similar results."""
@@ -143,7 +171,8 @@ class TestGameSimulator:
             light_strategy="random",
             dark_strategy="random",
             verbose=False,
-            parallel=True
+            parallel=True,
+            parallel_threshold=2
         )
         
         # Run sequential
@@ -163,6 +192,84 @@ class TestGameSimulator:
         assert len(data_manager_parallel.games) == num_games
         assert len(data_manager_sequential.games) == num_games
     
+    def test_shared_pool(self):
+        """Test that batches inside a pooled block reuse one worker pool."""
+        simulator = GameSimulator(GameDataManager("test_pool.json"))
+        
+        with simulator._pooled() as executor:
+            with simulator._pooled() as inner:
+                assert inner is executor
+            
+            analysis = simulator.run_batch_simulation(
+                num_games=2,
+                verbose=False,
+                parallel=True,
+                parallel_threshold=2
+            )
+            assert analysis["total_games"] == 2
+            assert simulator._executor is executor
+        
+        assert simulator._executor is None
+    
+    def test_random_fast_path(self):
+        """Test that the random vs random fast path plays the same games as GobbletGame."""
+        def move_keys(moves):
+            return [(move.player_color, move.move_type, move.piece_id, move.from_position,
+                     move.to_position, move.captured_piece_id) for move in moves]
+        
+        for seed in range(20):
+            random.seed(seed)
+            game = GobbletGame(RandomPlayer(PieceColor.LIGHT), RandomPlayer(PieceColor.DARK))
+            winner = game.play_game()
+            
+            random.seed(seed)
+            result, game_record = _play_random_random(4)
+            
+            assert result.winner == winner
+            assert result.turn_count == game.turn_count
+            assert result.move_count == len(game.move_tracker.moves)
+            assert game_record.winner == winner
+            assert game_record.player_strategies == {PieceColor.LIGHT: "random", PieceColor.DARK: "random"}
+            assert move_keys(game_record.moves) == move_keys(game.move_tracker.moves)
+    
+    def test_saves_append_to_data_file(self, tmp_path):
+        """Test that later saves append to the data file with the same JSON a full rewrite gives."""
+        data_file = tmp_path / "games.json"
+        data_manager = GameDataManager(str(data_file))
+        simulator = GameSimulator(data_manager)
+        
+        simulator.run_single_simulation()
+        simulator.run_batch_simulation(num_games=2, verbose=False)
+        simulator.run_single_simulation()
+        
+        expected = json.dumps([game.to_dict() for game in data_manager.games], indent=2)
+        assert data_file.read_text() == expected
+        
+        # A fresh manager picks up where the file left off
+        loaded_manager = GameDataManager(str(data_file))
+        assert len(loaded_manager.load_games()) == 4
+        GameSimulator(loaded_manager).run_single_simulation()
+        assert len(json.loads(data_file.read_text())) == 5
+    
+    def test_search_depth(self, tmp_path, monkeypatch):
+        """Test that the simulator's search depth reaches the players it creates."""
+        from src.gobblet.player import Player
+        
+        searches = []
+        negamax = Player._negamax
+        
+        def counting_negamax(player, *args):
+            searches.append(player.search_depth)
+            return negamax(player, *args)
+        
+        monkeypatch.setattr(Player, "_negamax", counting_negamax)
+        
+        simulator = GameSimulator(GameDataManager(str(tmp_path / "games.json")), search_depth=2)
+        assert simulator._create_player("greedy", PieceColor.LIGHT).search_depth == 2
+        
+        simulator.run_single_simulation("greedy", "defensive")
+        assert searches and set(searches) == {2}
+    
     def test_different_board_sizes(self):
         """Test simulation with different board sizes."""
         simulator = GameSimulator()
@@ -183,9 +290,9 @@ class TestGameSimulator:
             verbose=False
         )
         
-        assert "game_id" in result_3x3
-        assert "game_id" in result_5x5
-        assert result_3x3["game_id"] != result_5x5["game_id"]
+        assert result_3x3.game_id
+        assert result_5x5.game_id
+        assert result_3x3.game_id != result_5x5.game_id
     
     def test_strategy_matchups(self):
         """Test specific strategy matchups."""